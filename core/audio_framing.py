@@ -0,0 +1,210 @@
+"""
+上行音频分帧模块
+在采集端与 VolcengineTranslator.send_audio 之间按时长重新切帧:
+小块合并、大块拆分，并保证任何样本在本地滞留不超过 max_hold_ms
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+# 目标帧时长的允许范围 (ms)
+MIN_FRAME_MS = 20
+MAX_FRAME_MS = 200
+
+# 低延迟模式默认参数
+LOW_LATENCY_FRAME_MS = 40
+LOW_LATENCY_CAPTURE_BLOCK_MS = 20
+
+# 吞吐统计的滑动窗口 (秒)
+RATE_WINDOW_SECONDS = 5.0
+
+
+@dataclass
+class FramingConfig:
+    """上行分帧配置 (对应 config.yaml 中的 audio.framing)"""
+    frame_ms: int = 100
+    max_hold_ms: Optional[int] = None
+    low_latency: bool = False
+    capture_block_ms: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "FramingConfig":
+        data = data or {}
+        low_latency = bool(data.get("low_latency", False))
+        default_frame_ms = LOW_LATENCY_FRAME_MS if low_latency else 100
+        frame_ms = int(data.get("frame_ms") or default_frame_ms)
+        max_hold_ms = data.get("max_hold_ms")
+        capture_block_ms = data.get("capture_block_ms")
+        return cls(
+            frame_ms=min(MAX_FRAME_MS, max(MIN_FRAME_MS, frame_ms)),
+            max_hold_ms=int(max_hold_ms) if max_hold_ms else None,
+            low_latency=low_latency,
+            capture_block_ms=int(capture_block_ms) if capture_block_ms else None,
+        )
+
+    @property
+    def effective_max_hold_ms(self) -> int:
+        """未显式配置时，最长滞留时间等于目标帧时长。"""
+        return self.max_hold_ms if self.max_hold_ms else self.frame_ms
+
+    @property
+    def effective_capture_block_ms(self) -> int:
+        """采集块时长: 低延迟模式用小块，普通模式不超过目标帧时长。"""
+        if self.capture_block_ms:
+            return self.capture_block_ms
+        if self.low_latency:
+            return min(LOW_LATENCY_CAPTURE_BLOCK_MS, self.frame_ms)
+        return min(100, self.frame_ms)
+
+    def capture_chunk_size(self, sample_rate: int) -> int:
+        """采集端 blocksize (样本数)。"""
+        return max(1, int(sample_rate * self.effective_capture_block_ms / 1000))
+
+
+class AudioFramer:
+    """
+    按时长切分 PCM 上行帧
+
+    - push(): 追加采集数据，返回已凑满目标时长的完整帧 (大块会被拆成多帧)
+    - poll(): 最早一个缓存样本滞留超过 max_hold_ms 时，把不足一帧的尾巴直接发出
+    - time_until_deadline(): 距离下一次强制发送的剩余时间，供采集循环作为等待超时
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+        frame_ms: int = 100,
+        max_hold_ms: Optional[int] = None,
+    ):
+        """
+        初始化分帧器
+
+        Args:
+            sample_rate: 采样率
+            sample_width: 每样本字节数
+            channels: 声道数
+            frame_ms: 目标帧时长(ms)
+            max_hold_ms: 样本最长滞留时间(ms)，默认等于 frame_ms
+        """
+        self.sample_rate = sample_rate
+        self.frame_align = sample_width * channels
+        self.bytes_per_ms = sample_rate * self.frame_align / 1000
+        self.frame_ms = frame_ms
+        self.frame_bytes = self._align(int(self.bytes_per_ms * frame_ms))
+        self.max_hold = (max_hold_ms if max_hold_ms else frame_ms) / 1000
+
+        self._buffer = bytearray()
+        self._oldest_at: Optional[float] = None
+
+        self._started_at = time.perf_counter()
+        self._window = deque()
+        self._frames_total = 0
+        self._bytes_total = 0
+        self._deadline_flushes = 0
+        self._inputs_total = 0
+
+    @classmethod
+    def from_config(cls, config: FramingConfig, sample_rate: int = 16000) -> "AudioFramer":
+        return cls(
+            sample_rate=sample_rate,
+            frame_ms=config.frame_ms,
+            max_hold_ms=config.effective_max_hold_ms,
+        )
+
+    def _align(self, size: int) -> int:
+        return max(self.frame_align, size - size % self.frame_align)
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def pending_ms(self) -> float:
+        return len(self._buffer) / self.bytes_per_ms
+
+    def push(self, data: bytes, now: Optional[float] = None) -> List[bytes]:
+        """
+        追加一段采集数据
+
+        Returns:
+            本次凑满的完整帧列表 (可能为空)
+        """
+        if not data:
+            return []
+        now = time.perf_counter() if now is None else now
+        self._inputs_total += 1
+        if not self._buffer:
+            self._oldest_at = now
+        self._buffer += data
+
+        frames = []
+        while len(self._buffer) >= self.frame_bytes:
+            frames.append(self._take(self.frame_bytes, now))
+        return frames
+
+    def poll(self, now: Optional[float] = None) -> Optional[bytes]:
+        """滞留超时时返回不足一帧的剩余数据，否则返回 None。"""
+        if not self._buffer:
+            return None
+        now = time.perf_counter() if now is None else now
+        if now - self._oldest_at < self.max_hold:
+            return None
+        size = len(self._buffer) - len(self._buffer) % self.frame_align
+        if size <= 0:
+            return None
+        self._deadline_flushes += 1
+        return self._take(size, now)
+
+    def flush(self) -> Optional[bytes]:
+        """取出全部剩余数据 (停止或结束会话时使用)。"""
+        size = len(self._buffer) - len(self._buffer) % self.frame_align
+        if size <= 0:
+            return None
+        return self._take(size, time.perf_counter())
+
+    def time_until_deadline(self, now: Optional[float] = None) -> Optional[float]:
+        """距离缓存数据必须发出的剩余秒数；无缓存时返回 None。"""
+        if not self._buffer:
+            return None
+        now = time.perf_counter() if now is None else now
+        return max(0.0, self.max_hold - (now - self._oldest_at))
+
+    def _take(self, size: int, now: float) -> bytes:
+        frame = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        # 剩余数据视为刚到达: 最早样本已随本帧发出
+        self._oldest_at = now if self._buffer else None
+        self._record_frame(len(frame), now)
+        return frame
+
+    def _record_frame(self, size: int, now: float):
+        self._frames_total += 1
+        self._bytes_total += size
+        self._window.append((now, size))
+        while self._window and now - self._window[0][0] > RATE_WINDOW_SECONDS:
+            self._window.popleft()
+
+    def get_stats(self) -> dict:
+        """返回分帧统计 (帧率/字节率为最近 5 秒滑动窗口)。"""
+        now = time.perf_counter()
+        while self._window and now - self._window[0][0] > RATE_WINDOW_SECONDS:
+            self._window.popleft()
+        span = min(RATE_WINDOW_SECONDS, max(now - self._started_at, 1e-6))
+        window_bytes = sum(size for _, size in self._window)
+        return {
+            "frame_ms": self.frame_ms,
+            "max_hold_ms": round(self.max_hold * 1000, 1),
+            "frames_total": self._frames_total,
+            "bytes_total": self._bytes_total,
+            "frames_per_sec": round(len(self._window) / span, 1),
+            "bytes_per_sec": round(window_bytes / span, 1),
+            "avg_frame_ms": round(self._bytes_total / self._frames_total / self.bytes_per_ms, 1)
+            if self._frames_total else 0.0,
+            "deadline_flushes": self._deadline_flushes,
+            "capture_chunks": self._inputs_total,
+            "pending_ms": round(self.pending_ms, 1),
+        }
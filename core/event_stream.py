@@ -0,0 +1,131 @@
+"""
+翻译结果事件分发模块
+VolcengineTranslator 的常驻接收任务把每个响应解析一次后，按事件类别
+投递到订阅队列或回调，消费者只等待自己关心的类别
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 事件类别
+EVENT_AUDIO = "audio"                                # TTS 音频及句级起止标记
+EVENT_SOURCE_SUBTITLE = "source_subtitle"            # 原文字幕 650~652
+EVENT_TRANSLATION_SUBTITLE = "translation_subtitle"  # 译文字幕 653~655
+EVENT_LIFECYCLE = "lifecycle"                        # 会话启动/结束/失败等
+EVENT_USAGE = "usage"                                # UsageResponse 计费
+
+EVENT_KINDS = (
+    EVENT_AUDIO,
+    EVENT_SOURCE_SUBTITLE,
+    EVENT_TRANSLATION_SUBTITLE,
+    EVENT_LIFECYCLE,
+    EVENT_USAGE,
+)
+
+# 分发延迟统计窗口 (条)
+_LATENCY_WINDOW = 512
+
+
+class EventSubscription:
+    """
+    一组事件类别的订阅队列
+
+    get() 返回 None 表示被唤醒 (停止或接收任务退出)，调用方应检查自身运行状态。
+    """
+
+    def __init__(self, name: str, kinds: Iterable[str]):
+        self.name = name
+        self.kinds = tuple(kinds)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._delivered = 0
+        self._max_depth = 0
+        self._latencies = deque(maxlen=_LATENCY_WINDOW)
+
+    def put(self, result):
+        self.queue.put_nowait(result)
+        depth = self.queue.qsize()
+        if depth > self._max_depth:
+            self._max_depth = depth
+
+    def wake(self):
+        """投递 None，唤醒阻塞在 get() 上的消费者。"""
+        self.queue.put_nowait(None)
+
+    async def get(self):
+        """等待下一条事件，并记录从收到响应到被消费的分发延迟。"""
+        result = await self.queue.get()
+        if result is not None:
+            self._delivered += 1
+            received_at = getattr(result, "received_at", 0.0)
+            if received_at:
+                self._latencies.append(time.perf_counter() - received_at)
+        return result
+
+    def get_stats(self) -> dict:
+        latencies = sorted(self._latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+        return {
+            "kinds": list(self.kinds),
+            "depth": self.queue.qsize(),
+            "max_depth": self._max_depth,
+            "delivered": self._delivered,
+            "dispatch_avg_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "dispatch_p95_ms": round(p95 * 1000, 3),
+            "dispatch_max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        }
+
+
+class EventDispatcher:
+    """按事件类别把结果分发给订阅队列和回调。"""
+
+    def __init__(self):
+        self._subscriptions = {}
+        self._callbacks = {kind: [] for kind in EVENT_KINDS}
+        self._dispatched = {kind: 0 for kind in EVENT_KINDS}
+
+    def subscribe(self, *kinds: str, name: Optional[str] = None) -> EventSubscription:
+        """创建 (或返回同名) 订阅队列，多个类别共用一个队列时保持相对顺序。"""
+        for kind in kinds:
+            if kind not in self._callbacks:
+                raise ValueError(f"未知事件类别: {kind}")
+        name = name or "+".join(kinds)
+        subscription = self._subscriptions.get(name)
+        if subscription is None:
+            subscription = EventSubscription(name, kinds)
+            self._subscriptions[name] = subscription
+        return subscription
+
+    def add_callback(self, kind: str, callback):
+        """注册同步回调，在接收任务中直接调用 (不得阻塞)。"""
+        if kind not in self._callbacks:
+            raise ValueError(f"未知事件类别: {kind}")
+        self._callbacks[kind].append(callback)
+
+    def dispatch(self, kind: str, result):
+        self._dispatched[kind] += 1
+        for callback in self._callbacks[kind]:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error("事件回调执行出错 [%s]: %s", kind, e)
+        for subscription in self._subscriptions.values():
+            if kind in subscription.kinds:
+                subscription.put(result)
+
+    def wake_all(self):
+        for subscription in self._subscriptions.values():
+            subscription.wake()
+
+    def get_stats(self) -> dict:
+        return {
+            "dispatched": dict(self._dispatched),
+            "subscriptions": {
+                name: subscription.get_stats()
+                for name, subscription in self._subscriptions.items()
+            },
+        }
@@ -0,0 +1,69 @@
+"""
+TaskRequest 快速编码模块
+音频帧请求除 binary_data 外每帧都相同，按会话预先序列化固定前缀，
+每帧只拼接 source_audio 字段，输出与 TranslateRequest.SerializeToString() 逐字节一致
+"""
+
+# TranslateRequest.source_audio = 4 (length-delimited)
+_SOURCE_AUDIO_TAG = b"\x22"
+# Audio.binary_data = 14 (length-delimited)
+_BINARY_DATA_TAG = b"\x72"
+
+# 128 以内的长度直接查表
+_SMALL_VARINTS = [bytes((i,)) for i in range(128)]
+
+
+def encode_varint(value: int) -> bytes:
+    """protobuf base-128 varint 编码 (仅非负数)。"""
+    if value < 128:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+class TaskRequestEncoder:
+    """
+    单会话的 TaskRequest 编码器
+
+    字段按编号顺序序列化: request_meta(1) → event(2) → source_audio(4)，
+    前两者在会话内不变，由调用方用 protobuf 生成一次后传入。
+    """
+
+    def __init__(self, session_id: str, prefix: bytes):
+        """
+        Args:
+            session_id: 所属会话 ID
+            prefix: 仅设置了 SessionID 和 event 的 TranslateRequest 序列化结果
+        """
+        self.session_id = session_id
+        self.prefix = bytes(prefix)
+        # 空音频时 source_audio 仍为已设置的空消息
+        self._empty_frame = self.prefix + _SOURCE_AUDIO_TAG + b"\x00"
+
+    def encode(self, audio_data) -> bytes:
+        """
+        编码一帧音频请求
+
+        Args:
+            audio_data: bytes / bytearray / memoryview 形式的音频数据
+
+        Returns:
+            序列化后的 TranslateRequest
+        """
+        size = len(audio_data)
+        if size == 0:
+            return self._empty_frame
+        size_varint = encode_varint(size)
+        inner_size = 1 + len(size_varint) + size
+        return b"".join((
+            self.prefix,
+            _SOURCE_AUDIO_TAG,
+            encode_varint(inner_size),
+            _BINARY_DATA_TAG,
+            size_varint,
+            audio_data,
+        ))
@@ -0,0 +1,218 @@
+"""
+热备会话模块
+为单个翻译方向常驻一条已启动会话的备用连接，只发送少量静音保活；
+主会话失败时在同一事件循环 tick 内切换过去，随后在后台重建新的热备
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from core.session_pool import PreparedSession, discard_session, is_connection_open
+
+logger = logging.getLogger(__name__)
+
+
+class HotStandby:
+    """
+    单方向热备会话
+
+    - 后台建立一条就绪会话，按 keepalive_interval 发送 keepalive_audio_ms 的静音，
+      防止服务端因无音频而超时关闭
+    - 同时持续读取并丢弃热备连接上的响应，发现会话失败/连接断开立即重建
+    - take() 同步返回热备会话，不经过任何网络往返
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[PreparedSession]],
+        encode_frame: Callable[[str, bytes], bytes],
+        is_terminal_response: Callable[[bytes], bool],
+        keepalive_interval: float = 0.5,
+        keepalive_audio_ms: int = 20,
+        bytes_per_ms: int = 32,
+        retry_delay: float = 2.0,
+        name: str = "",
+    ):
+        """
+        初始化热备
+
+        Args:
+            factory: 创建就绪会话的协程工厂 (建连 + StartSession)
+            encode_frame: (session_id, audio) → 序列化后的 TaskRequest
+            is_terminal_response: 判断热备连接上收到的响应是否表示会话已结束
+            keepalive_interval: 静音保活间隔(秒)
+            keepalive_audio_ms: 每次保活发送的静音时长(ms)
+            bytes_per_ms: 上行音频每毫秒字节数
+            retry_delay: 建立热备失败后的重试间隔(秒)
+            name: 日志标识
+        """
+        self.factory = factory
+        self.encode_frame = encode_frame
+        self.is_terminal_response = is_terminal_response
+        self.keepalive_interval = keepalive_interval
+        self.retry_delay = retry_delay
+        self.name = name
+        self._silence = b"\x00" * (keepalive_audio_ms * bytes_per_ms)
+
+        self._standby: Optional[PreparedSession] = None
+        self._standby_tasks = []
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+        self._stats = {
+            "builds": 0,
+            "build_failures": 0,
+            "lost": 0,
+            "keepalive_frames": 0,
+            "switchovers": 0,
+            "last_switchover_ms": 0.0,
+            "max_switchover_ms": 0.0,
+            "switchover_ms_total": 0.0,
+        }
+
+    @property
+    def is_ready(self) -> bool:
+        return self._standby is not None and is_connection_open(self._standby.conn)
+
+    def start(self):
+        """启动热备维护任务 (需在事件循环中调用)。"""
+        if self._running:
+            return
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._maintain_loop())
+        logger.info("🛡️  热备会话已启用 [%s] 保活间隔=%.1fs", self.name, self.keepalive_interval)
+
+    async def close(self):
+        """停止维护并关闭热备连接。"""
+        self._running = False
+        tasks = self._stop_standby_tasks()
+        if self._task:
+            self._task.cancel()
+            tasks.append(self._task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        standby, self._standby = self._standby, None
+        if standby:
+            await discard_session(standby)
+
+    def take(self, failed_at: Optional[float] = None) -> Optional[PreparedSession]:
+        """
+        立即取走热备会话 (同步，不产生网络往返)
+
+        Args:
+            failed_at: 主会话失败被发现的 perf_counter 时间，用于统计切换耗时
+
+        Returns:
+            热备会话；未就绪时返回 None
+        """
+        if not self.is_ready:
+            return None
+        standby, self._standby = self._standby, None
+        self._stop_standby_tasks()
+
+        switchover_ms = (time.perf_counter() - failed_at) * 1000 if failed_at else 0.0
+        stats = self._stats
+        stats["switchovers"] += 1
+        stats["last_switchover_ms"] = switchover_ms
+        stats["max_switchover_ms"] = max(stats["max_switchover_ms"], switchover_ms)
+        stats["switchover_ms_total"] += switchover_ms
+        logger.info("⚡ 切换到热备会话 [%s] id=%s 切换耗时=%.2fms", self.name, standby.session_id, switchover_ms)
+
+        # 后台重建新的热备
+        if self._wakeup:
+            self._wakeup.set()
+        return standby
+
+    def get_stats(self) -> dict:
+        stats = self._stats
+        switchovers = stats["switchovers"]
+        return {
+            "ready": self.is_ready,
+            "session_id": self._standby.session_id if self._standby else None,
+            "builds": stats["builds"],
+            "build_failures": stats["build_failures"],
+            "lost": stats["lost"],
+            "keepalive_frames": stats["keepalive_frames"],
+            "switchovers": switchovers,
+            "last_switchover_ms": round(stats["last_switchover_ms"], 3),
+            "max_switchover_ms": round(stats["max_switchover_ms"], 3),
+            "avg_switchover_ms": round(stats["switchover_ms_total"] / switchovers, 3) if switchovers else 0.0,
+        }
+
+    def _stop_standby_tasks(self) -> list:
+        tasks, self._standby_tasks = self._standby_tasks, []
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    async def _maintain_loop(self):
+        """保证始终有一条热备会话；被取走或失效后重建。"""
+        while self._running:
+            if self._standby is None:
+                try:
+                    standby = await self.factory()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._stats["build_failures"] += 1
+                    logger.warning("⚠️  热备会话建立失败 [%s]: %s", self.name, e)
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+
+                if not self._running:
+                    await discard_session(standby)
+                    return
+                self._standby = standby
+                self._stats["builds"] += 1
+                self._standby_tasks = [
+                    asyncio.create_task(self._keepalive_loop(standby)),
+                    asyncio.create_task(self._drain_loop(standby)),
+                ]
+                logger.debug("热备会话就绪 [%s] id=%s 耗时=%.0fms", self.name, standby.session_id,
+                             standby.prepare_seconds * 1000)
+
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    async def _keepalive_loop(self, standby: PreparedSession):
+        frame = self.encode_frame(standby.session_id, self._silence)
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await standby.conn.send(frame)
+            except Exception as e:
+                self._on_standby_lost(standby, f"保活发送失败: {e}")
+                return
+            standby.audio_bytes_sent += len(self._silence)
+            self._stats["keepalive_frames"] += 1
+
+    async def _drain_loop(self, standby: PreparedSession):
+        """读取并丢弃热备连接上的响应，会话结束或连接断开时触发重建。"""
+        while True:
+            try:
+                data = await standby.conn.recv()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_standby_lost(standby, f"连接断开: {e}")
+                return
+            if self.is_terminal_response(data):
+                self._on_standby_lost(standby, "会话已结束")
+                return
+
+    def _on_standby_lost(self, standby: PreparedSession, reason: str):
+        if self._standby is not standby:
+            return
+        self._standby = None
+        self._stats["lost"] += 1
+        logger.warning("⚠️  热备会话失效 [%s]: %s，后台重建", self.name, reason)
+        # 当前任务也在其中，取消请求会在其返回后生效
+        self._stop_standby_tasks()
+        asyncio.create_task(discard_session(standby))
+        if self._wakeup:
+            self._wakeup.set()
@@ -0,0 +1,105 @@
+"""
+Ogg 容器工具模块
+提供 Ogg 页封装与 Opus 头构造，供本地模拟服务端生成 ogg_opus 音频使用
+"""
+
+import struct
+from typing import Iterable, List
+
+# Ogg 页 CRC32: 多项式 0x04C11DB7, 非反射, 初值 0
+_CRC_TABLE = []
+for _i in range(256):
+    _r = _i << 24
+    for _ in range(8):
+        _r = ((_r << 1) ^ 0x04C11DB7) if _r & 0x80000000 else (_r << 1)
+    _CRC_TABLE.append(_r & 0xFFFFFFFF)
+
+# Opus 固定按 48kHz 计算 granule position
+OPUS_GRANULE_RATE = 48000
+
+# 20ms 全频带 CELT 静音帧，任何 Opus 解码器都能解出静音
+OPUS_SILENCE_FRAME = b"\xf8\xff\xfe"
+OPUS_SILENCE_FRAME_SAMPLES = 960
+
+
+def ogg_crc32(data: bytes) -> int:
+    """计算 Ogg 页校验和。"""
+    crc = 0
+    table = _CRC_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ table[((crc >> 24) ^ byte) & 0xFF]
+    return crc
+
+
+def build_opus_head(channels: int = 1, input_rate: int = 48000, pre_skip: int = 312) -> bytes:
+    """构造 OpusHead 标识包 (RFC 7845 §5.1)。"""
+    return b"OpusHead" + struct.pack("<BBHIhB", 1, channels, pre_skip, input_rate, 0, 0)
+
+
+def build_opus_tags(vendor: str = "realtime_translator") -> bytes:
+    """构造 OpusTags 注释包 (RFC 7845 §5.2)。"""
+    vendor_bytes = vendor.encode("utf-8")
+    return b"OpusTags" + struct.pack("<I", len(vendor_bytes)) + vendor_bytes + struct.pack("<I", 0)
+
+
+class OggPageWriter:
+    """
+    Ogg 逻辑流封装器
+
+    每次调用 write_page() 把一组完整数据包打成一个 Ogg 页，
+    自动维护页序号、BOS/EOS 标志和校验和。
+    """
+
+    def __init__(self, serial: int = 0x52545452):
+        self.serial = serial & 0xFFFFFFFF
+        self.page_sequence = 0
+        self._bos_written = False
+
+    def write_page(self, packets: Iterable[bytes], granule_position: int, eos: bool = False) -> bytes:
+        """
+        把数据包打包成一个 Ogg 页
+
+        Args:
+            packets: 完整数据包列表 (单页最多 255 个 lacing 段)
+            granule_position: 页尾的 granule position
+            eos: 是否为逻辑流最后一页
+
+        Returns:
+            完整的 Ogg 页字节
+        """
+        lacing: List[int] = []
+        body = bytearray()
+        for packet in packets:
+            size = len(packet)
+            lacing.extend([255] * (size // 255))
+            lacing.append(size % 255)
+            body += packet
+
+        if len(lacing) > 255:
+            raise ValueError(f"单个 Ogg 页的 lacing 段过多: {len(lacing)}")
+
+        header_type = 0
+        if not self._bos_written:
+            header_type |= 0x02
+            self._bos_written = True
+        if eos:
+            header_type |= 0x04
+
+        header = struct.pack(
+            "<4sBBqIIIB",
+            b"OggS",
+            0,
+            header_type,
+            granule_position,
+            self.serial,
+            self.page_sequence,
+            0,
+            len(lacing),
+        ) + bytes(lacing)
+
+        page = bytearray(header + body)
+        crc = ogg_crc32(page)
+        page[22:26] = struct.pack("<I", crc)
+
+        self.page_sequence += 1
+        return bytes(page)
@@ -0,0 +1,119 @@
+"""
+上行音频回放缓冲模块
+按帧保存最近发送 (或在恢复期间暂存) 的上行音频，会话恢复后从最后一个
+已确认的句子边界开始回放，避免故障期间说的话丢失
+"""
+
+import time
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+
+class ReplayBuffer:
+    """
+    有界的上行音频环形缓冲
+
+    所有位置都用单调递增的字节偏移表示 (从第一帧开始累计)，
+    与会话无关；会话内的服务端时间戳需由调用方换算为偏移。
+    """
+
+    def __init__(self, max_seconds: float = 30.0, bytes_per_second: int = 32000, frame_align: int = 2):
+        """
+        初始化回放缓冲
+
+        Args:
+            max_seconds: 最多保留的音频时长(秒)
+            bytes_per_second: 上行音频字节率 (16kHz/16bit/单声道 = 32000)
+            frame_align: 样本对齐字节数
+        """
+        self.max_bytes = int(max_seconds * bytes_per_second)
+        self.bytes_per_second = bytes_per_second
+        self.frame_align = frame_align
+
+        self._starts: List[int] = []
+        self._frames: List[bytes] = []
+        self._captured_at: List[float] = []
+        self._start_offset = 0
+        self._end_offset = 0
+
+    @property
+    def start_offset(self) -> int:
+        """缓冲中最早数据的偏移。"""
+        return self._start_offset
+
+    @property
+    def end_offset(self) -> int:
+        """已写入数据的总字节数 (下一帧的起始偏移)。"""
+        return self._end_offset
+
+    @property
+    def buffered_seconds(self) -> float:
+        return (self._end_offset - self._start_offset) / self.bytes_per_second
+
+    def ms_to_bytes(self, ms: float) -> int:
+        size = int(ms * self.bytes_per_second / 1000)
+        return size - size % self.frame_align
+
+    def append(self, frame: bytes, captured_at: Optional[float] = None) -> int:
+        """追加一帧，返回该帧的起始偏移。"""
+        offset = self._end_offset
+        self._starts.append(offset)
+        self._frames.append(bytes(frame))
+        self._captured_at.append(time.perf_counter() if captured_at is None else captured_at)
+        self._end_offset += len(frame)
+
+        # 超出容量时整帧淘汰最早的数据
+        drop = 0
+        while drop < len(self._frames) - 1 and self._end_offset - self._starts[drop + 1] >= self.max_bytes:
+            drop += 1
+        if drop:
+            del self._starts[:drop]
+            del self._frames[:drop]
+            del self._captured_at[:drop]
+            self._start_offset = self._starts[0]
+        return offset
+
+    def read_from(self, offset: int, max_bytes: Optional[int] = None) -> Tuple[int, bytes]:
+        """
+        读取从 offset 开始的一段连续数据
+
+        Args:
+            offset: 起始偏移 (早于缓冲起点时从起点开始)
+            max_bytes: 最多返回的字节数 (可跨帧拼接)，None 表示只返回 offset 所在帧的剩余部分
+
+        Returns:
+            (实际起始偏移, 数据)；没有更多数据时数据为空
+        """
+        offset = max(offset, self._start_offset)
+        if offset >= self._end_offset or not self._frames:
+            return offset, b""
+
+        index = bisect_right(self._starts, offset) - 1
+        chunks = []
+        size = 0
+        position = offset
+        while index < len(self._frames):
+            frame = self._frames[index]
+            skip = position - self._starts[index]
+            piece = frame[skip:] if skip else frame
+            if max_bytes is not None and size + len(piece) > max_bytes:
+                piece = piece[:max_bytes - size]
+            chunks.append(piece)
+            size += len(piece)
+            position += len(piece)
+            index += 1
+            if max_bytes is None or size >= max_bytes:
+                break
+        return offset, b"".join(chunks)
+
+    def captured_at(self, offset: int) -> Optional[float]:
+        """返回 offset 所在帧的采集时间。"""
+        if offset < self._start_offset or offset >= self._end_offset:
+            return None
+        return self._captured_at[bisect_right(self._starts, offset) - 1]
+
+    def clear(self):
+        self._starts.clear()
+        self._frames.clear()
+        self._captured_at.clear()
+        self._start_offset = self._end_offset
@@ -0,0 +1,301 @@
+"""
+会话预热池
+为每个翻译方向预先建立 "已鉴权连接 + 已启动会话"，启动和故障恢复时直接接管，
+省掉 DNS + TLS + WebSocket 握手 + StartSession 往返的时间。
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PreparedSession:
+    """已完成握手并启动会话、等待接管的连接"""
+    conn: Any
+    session_id: str
+    log_id: str = "unknown"
+    created_at: float = field(default_factory=time.perf_counter)
+    prepare_seconds: float = 0.0
+    audio_bytes_sent: int = 0  # 接管前已在该会话上发送的音频 (如热备保活静音)
+
+    @property
+    def idle_seconds(self) -> float:
+        return time.perf_counter() - self.created_at
+
+
+def is_connection_open(conn) -> bool:
+    """兼容 websockets 新旧实现，判断连接是否仍处于 OPEN 状态。"""
+    if conn is None:
+        return False
+    state = getattr(conn, "state", None)
+    if state is not None:
+        return getattr(state, "name", str(state)) == "OPEN"
+    return bool(getattr(conn, "open", False))
+
+
+async def probe_connection(conn, timeout: float) -> Optional[float]:
+    """发送一次 WebSocket ping，返回往返时间(秒)；失败或超时返回 None。"""
+    if not is_connection_open(conn):
+        return None
+    try:
+        started = time.perf_counter()
+        pong_waiter = await conn.ping()
+        await asyncio.wait_for(pong_waiter, timeout=timeout)
+        return time.perf_counter() - started
+    except Exception:
+        return None
+
+
+async def close_connection_quietly(conn):
+    """关闭不再使用的连接，忽略关闭过程中的异常。"""
+    try:
+        await conn.close()
+    except Exception as e:
+        logger.debug("关闭连接失败: %s", e)
+
+
+async def discard_session(prepared: PreparedSession):
+    """关闭不再使用的预热连接。"""
+    await close_connection_quietly(prepared.conn)
+
+
+class SessionPool:
+    """
+    单方向的会话预热池
+
+    - 后台保持 size 个就绪会话，被取走后立即异步补充
+    - 定期 ping 做健康检查，超过 max_idle_seconds 的会话按过期淘汰重建
+    - 记录每次接管相对冷启动节省的时间
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[PreparedSession]],
+        size: int = 1,
+        max_idle_seconds: float = 30.0,
+        health_check_interval: float = 5.0,
+        health_check_timeout: float = 2.0,
+        name: str = "",
+    ):
+        """
+        初始化预热池
+
+        Args:
+            factory: 创建一个就绪会话的协程工厂 (建连 + StartSession)
+            size: 池内保持的就绪会话数
+            max_idle_seconds: 就绪会话最长闲置时间，超时淘汰重建
+            health_check_interval: 健康检查间隔(秒)
+            health_check_timeout: 单次 ping 超时(秒)
+            name: 日志标识
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_idle_seconds = max_idle_seconds
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.name = name
+
+        self._ready: List[PreparedSession] = []
+        self._filling = 0
+        self._fill_tasks = set()
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._ready_event: Optional[asyncio.Event] = None
+        self._running = False
+
+        self._stats = {
+            "prepared": 0,
+            "prepare_failures": 0,
+            "expired": 0,
+            "unhealthy": 0,
+            "handoffs": 0,
+            "misses": 0,
+            "saved_seconds_total": 0.0,
+            "last_saved_ms": 0.0,
+            "last_prepare_ms": 0.0,
+        }
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready)
+
+    def start(self):
+        """启动后台填充与健康检查 (需在事件循环中调用)。"""
+        if self._running:
+            return
+        self._running = True
+        self._ready_event = asyncio.Event()
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        self._refill()
+        logger.info("🏊 会话预热池已启动 [%s] size=%d 过期=%.0fs", self.name, self.size, self.max_idle_seconds)
+
+    async def close(self):
+        """停止预热池并关闭所有闲置连接。"""
+        self._running = False
+        tasks = list(self._fill_tasks)
+        if self._maintenance_task:
+            tasks.append(self._maintenance_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        ready, self._ready = self._ready, []
+        for prepared in ready:
+            await discard_session(prepared)
+        self._maintenance_task = None
+
+    def acquire_nowait(self) -> Optional[PreparedSession]:
+        """立即取出一个健康的就绪会话；没有时返回 None。"""
+        while self._ready:
+            prepared = self._ready.pop(0)
+            if is_connection_open(prepared.conn) and prepared.idle_seconds < self.max_idle_seconds:
+                self._record_handoff(prepared, waited=0.0)
+                self._refill()
+                return prepared
+            self._stats["expired"] += 1
+            asyncio.create_task(discard_session(prepared))
+
+        self._stats["misses"] += 1
+        self._refill()
+        return None
+
+    async def acquire(self, timeout: Optional[float] = None) -> Optional[PreparedSession]:
+        """
+        取出一个就绪会话；若正在预热则等待其完成
+
+        Args:
+            timeout: 最长等待时间(秒)，None 表示等到预热结束
+
+        Returns:
+            就绪会话，池未运行或等待超时返回 None
+        """
+        if not self._running:
+            return None
+
+        started = time.perf_counter()
+        deadline = None if timeout is None else started + timeout
+        failures_before = self._stats["prepare_failures"]
+        while self._running:
+            while self._ready:
+                prepared = self._ready.pop(0)
+                if is_connection_open(prepared.conn) and prepared.idle_seconds < self.max_idle_seconds:
+                    self._record_handoff(prepared, waited=time.perf_counter() - started)
+                    self._refill()
+                    return prepared
+                self._stats["expired"] += 1
+                asyncio.create_task(discard_session(prepared))
+
+            # 本轮预热已失败，交给调用方走冷启动路径并暴露真实错误
+            if self._stats["prepare_failures"] > failures_before:
+                break
+
+            self._refill()
+            if self._filling == 0:
+                break
+
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                break
+            self._ready_event.clear()
+            try:
+                await asyncio.wait_for(self._ready_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+
+        self._stats["misses"] += 1
+        return None
+
+    def get_stats(self) -> dict:
+        """返回预热池统计，供诊断快照使用。"""
+        handoffs = self._stats["handoffs"]
+        return {
+            "ready": len(self._ready),
+            "filling": self._filling,
+            "prepared": self._stats["prepared"],
+            "prepare_failures": self._stats["prepare_failures"],
+            "expired": self._stats["expired"],
+            "unhealthy": self._stats["unhealthy"],
+            "handoffs": handoffs,
+            "misses": self._stats["misses"],
+            "last_prepare_ms": round(self._stats["last_prepare_ms"], 1),
+            "last_saved_ms": round(self._stats["last_saved_ms"], 1),
+            "avg_saved_ms": round(self._stats["saved_seconds_total"] / handoffs * 1000, 1) if handoffs else 0.0,
+            "saved_seconds_total": round(self._stats["saved_seconds_total"], 3),
+        }
+
+    def _record_handoff(self, prepared: PreparedSession, waited: float):
+        saved = max(0.0, prepared.prepare_seconds - waited)
+        self._stats["handoffs"] += 1
+        self._stats["saved_seconds_total"] += saved
+        self._stats["last_saved_ms"] = saved * 1000
+        logger.info(
+            "⚡ 接管预热会话 [%s] id=%s 闲置=%.1fs 等待=%.0fms 节省≈%.0fms",
+            self.name, prepared.session_id, prepared.idle_seconds, waited * 1000, saved * 1000,
+        )
+
+    def _refill(self):
+        """补足就绪会话数量 (含正在预热的)。"""
+        if not self._running:
+            return
+        while len(self._ready) + self._filling < self.size:
+            self._filling += 1
+            task = asyncio.create_task(self._fill_one())
+            self._fill_tasks.add(task)
+            task.add_done_callback(self._fill_tasks.discard)
+
+    async def _fill_one(self):
+        try:
+            try:
+                prepared = await self.factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["prepare_failures"] += 1
+                logger.warning("⚠️  会话预热失败 [%s]: %s", self.name, e)
+                self._wake_waiters()
+                # 失败后保持占位一段时间再允许重试，避免对服务端形成重连风暴
+                await asyncio.sleep(min(self.health_check_interval, 5.0))
+                return
+
+            if not self._running:
+                await discard_session(prepared)
+                return
+
+            self._ready.append(prepared)
+            self._stats["prepared"] += 1
+            self._stats["last_prepare_ms"] = prepared.prepare_seconds * 1000
+            logger.debug("会话预热完成 [%s] id=%s 耗时=%.0fms", self.name, prepared.session_id,
+                         prepared.prepare_seconds * 1000)
+        finally:
+            self._filling -= 1
+            self._wake_waiters()
+
+    def _wake_waiters(self):
+        if self._ready_event:
+            self._ready_event.set()
+
+    async def _maintenance_loop(self):
+        """定期健康检查与过期淘汰。"""
+        while self._running:
+            await asyncio.sleep(self.health_check_interval)
+
+            for prepared in list(self._ready):
+                if prepared.idle_seconds >= self.max_idle_seconds:
+                    reason = "expired"
+                elif await probe_connection(prepared.conn, self.health_check_timeout) is None:
+                    reason = "unhealthy"
+                else:
+                    continue
+
+                if prepared in self._ready:
+                    self._ready.remove(prepared)
+                    self._stats[reason] += 1
+                    logger.debug("淘汰预热会话 [%s] id=%s 原因=%s", self.name, prepared.session_id, reason)
+                    await discard_session(prepared)
+
+            self._refill()
@@ -0,0 +1,56 @@
+from core.audio_framing import AudioFramer, FramingConfig
+
+BYTES_PER_MS = 32  # 16kHz * 16bit * mono
+
+
+def _pcm(ms):
+    return b"\x01\x00" * (16 * ms)
+
+
+def test_small_blocks_are_coalesced_into_target_frames():
+    framer = AudioFramer(frame_ms=100)
+    frames = []
+    for i in range(10):
+        frames += framer.push(_pcm(20), now=i * 0.02)
+
+    assert [len(f) for f in frames] == [100 * BYTES_PER_MS, 100 * BYTES_PER_MS]
+    assert framer.pending_bytes == 0
+
+
+def test_large_block_is_split_and_remainder_kept():
+    framer = AudioFramer(frame_ms=40)
+    frames = framer.push(_pcm(100), now=0.0)
+
+    assert [len(f) for f in frames] == [40 * BYTES_PER_MS, 40 * BYTES_PER_MS]
+    assert framer.pending_ms == 20
+
+
+def test_partial_frame_is_released_at_max_hold_deadline():
+    framer = AudioFramer(frame_ms=200, max_hold_ms=60)
+    assert framer.push(_pcm(20), now=1.0) == []
+    assert framer.poll(now=1.05) is None
+    assert abs(framer.time_until_deadline(now=1.05) - 0.01) < 1e-9
+
+    frame = framer.poll(now=1.06)
+    assert len(frame) == 20 * BYTES_PER_MS
+    assert framer.time_until_deadline() is None
+    assert framer.get_stats()["deadline_flushes"] == 1
+
+
+def test_frames_stay_sample_aligned_for_odd_input():
+    framer = AudioFramer(frame_ms=20)
+    framer.push(b"\x00" * 641, now=0.0)
+    tail = framer.flush()
+
+    assert tail is None or len(tail) % 2 == 0
+    assert framer.pending_bytes == 1
+
+
+def test_low_latency_config_uses_small_capture_blocks():
+    config = FramingConfig.from_dict({"low_latency": True})
+
+    assert config.frame_ms == 40
+    assert config.effective_capture_block_ms == 20
+    assert config.capture_chunk_size(16000) == 320
+    assert FramingConfig.from_dict({"frame_ms": 500}).frame_ms == 200
+    assert FramingConfig.from_dict(None).capture_chunk_size(16000) == 1600
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from core.frame_encoder import TaskRequestEncoder, encode_varint
+from core.volcengine_client import TranslateRequest, Type
+
+
+def _reference(session_id, audio):
+    request = TranslateRequest()
+    request.request_meta.SessionID = session_id
+    request.event = Type.TaskRequest
+    request.source_audio.binary_data = audio
+    return request.SerializeToString()
+
+
+def _encoder(session_id):
+    request = TranslateRequest()
+    request.request_meta.SessionID = session_id
+    request.event = Type.TaskRequest
+    return TaskRequestEncoder(session_id, request.SerializeToString())
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 125, 126, 127, 128, 640, 3200, 6400, 16381, 16382, 16384, 2097152])
+@pytest.mark.parametrize("session_id", ["", "3f1c6a4e-0d7b-4f8e-9b1a-2c5d8e7f6a10", "s" * 200])
+def test_encoder_matches_protobuf_serialization(size, session_id):
+    audio = os.urandom(size)
+    assert _encoder(session_id).encode(audio) == _reference(session_id, audio)
+
+
+def test_encoder_accepts_buffer_views():
+    audio = bytearray(os.urandom(3200))
+    encoder = _encoder("abc")
+
+    assert encoder.encode(memoryview(audio)) == _reference("abc", bytes(audio))
+    assert encoder.encode(audio) == _reference("abc", bytes(audio))
+
+
+def test_encoded_frame_round_trips():
+    audio = os.urandom(3200)
+    parsed = TranslateRequest()
+    parsed.ParseFromString(_encoder("session-1").encode(audio))
+
+    assert parsed.request_meta.SessionID == "session-1"
+    assert parsed.event == Type.TaskRequest
+    assert parsed.source_audio.binary_data == audio
+
+
+def test_varint_boundaries():
+    assert encode_varint(0) == b"\x00"
+    assert encode_varint(127) == b"\x7f"
+    assert encode_varint(128) == b"\x80\x01"
+    assert encode_varint(300) == b"\xac\x02"
+    assert encode_varint(16384) == b"\x80\x80\x01"
@@ -0,0 +1,37 @@
+from core.replay_buffer import ReplayBuffer
+
+
+def _frame(value, size=3200):
+    return bytes([value]) * size
+
+
+def test_read_from_spans_frames_and_slices_partial_frame():
+    buffer = ReplayBuffer(max_seconds=10)
+    for i in range(3):
+        buffer.append(_frame(i))
+
+    start, data = buffer.read_from(1600, max_bytes=3200)
+    assert start == 1600
+    assert data == _frame(0, 1600) + _frame(1, 1600)
+
+    start, data = buffer.read_from(start + len(data), max_bytes=100000)
+    assert data == _frame(1, 1600) + _frame(2)
+    assert buffer.read_from(buffer.end_offset) == (buffer.end_offset, b"")
+
+
+def test_buffer_is_bounded_and_clamps_reads_to_oldest_frame():
+    buffer = ReplayBuffer(max_seconds=0.3)  # 9600 bytes
+    for i in range(10):
+        buffer.append(_frame(i))
+
+    assert buffer.end_offset == 32000
+    assert buffer.end_offset - buffer.start_offset <= 9600 + 3200
+    start, data = buffer.read_from(0)
+    assert start == buffer.start_offset
+    assert data == _frame(buffer.start_offset // 3200)
+
+
+def test_ms_to_bytes_is_sample_aligned():
+    buffer = ReplayBuffer(bytes_per_second=32000, frame_align=2)
+    assert buffer.ms_to_bytes(1000) == 32000
+    assert buffer.ms_to_bytes(0.03) % 2 == 0
@@ -0,0 +1,287 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+from core.event_stream import (
+    EVENT_AUDIO,
+    EVENT_LIFECYCLE,
+    EVENT_SOURCE_SUBTITLE,
+    EVENT_TRANSLATION_SUBTITLE,
+    EVENT_USAGE,
+)
+from core.volcengine_client import Type, VolcengineConfig, VolcengineTranslator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_mock_server():
+    """按文件路径加载 scripts/mock_ast_server.py（scripts 不是包）。"""
+    name = "mock_ast_server"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, PROJECT_ROOT / "scripts" / "mock_ast_server.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+mock = _load_mock_server()
+
+
+def _fast_config(**overrides):
+    params = dict(
+        processing_delay_ms=5,
+        text_step_delay_ms=1,
+        tts_delay_ms=5,
+        burst_interval_ms=5,
+        sentence_gap_ms=0,
+        silence_ms=200,
+    )
+    params.update(overrides)
+    return mock.MockServerConfig(**params)
+
+
+def _make_translator(url, **kwargs):
+    params = dict(
+        config=VolcengineConfig(ws_url=url, app_key="test", access_key="test"),
+        mode="s2s",
+        source_language="zh",
+        target_language="en",
+        target_audio_format="pcm",
+        target_audio_rate=48000,
+    )
+    params.update(kwargs)
+    return VolcengineTranslator(**params)
+
+
+async def _send_sentence(translator, speech_ms=600, pause_ms=400):
+    audio = mock.synth_speech_pcm(speech_ms) + mock.synth_silence_pcm(pause_ms)
+    for offset in range(0, len(audio), 3200):
+        await translator.send_audio(audio[offset:offset + 3200])
+
+
+async def _collect_until(translator, event, limit=200):
+    events = []
+    for _ in range(limit):
+        result = await asyncio.wait_for(translator.receive_result(), timeout=5)
+        events.append(result)
+        if result.event == event:
+            break
+    return events
+
+
+def test_mock_server_full_sentence_lifecycle():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config())
+        url = await server.start()
+        translator = _make_translator(url)
+        try:
+            await translator.connect()
+            await translator.start_session()
+            await _send_sentence(translator)
+            results = await _collect_until(translator, Type.TTSSentenceEnd)
+        finally:
+            await translator.close()
+            await server.stop()
+        return server, results
+
+    server, results = asyncio.run(scenario())
+    events = [r.event for r in results]
+
+    assert events[0] == Type.SourceSubtitleStart
+    assert Type.SourceSubtitleEnd in events
+    assert Type.TranslationSubtitleEnd in events
+    assert events.index(Type.TranslationSubtitleEnd) < events.index(Type.TTSSentenceStart)
+    audio = b"".join(r.audio_data for r in results)
+    assert audio and len(audio) % 2 == 0
+    assert server.stats["sessions_finished"] == 1
+
+
+def test_mock_server_ogg_audio_is_valid_ogg_stream():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config())
+        url = await server.start()
+        translator = _make_translator(url, target_audio_format="ogg_opus", target_audio_rate=24000)
+        try:
+            await translator.connect()
+            await translator.start_session()
+            await _send_sentence(translator)
+            return await _collect_until(translator, Type.TTSSentenceEnd)
+        finally:
+            await translator.close()
+            await server.stop()
+
+    results = asyncio.run(scenario())
+    packets = [r.audio_data for r in results if r.audio_data]
+
+    assert packets[0].startswith(b"OggS")
+    assert b"OpusHead" in packets[0]
+
+
+def test_session_pool_hands_off_prepared_session_on_connect_and_recovery():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config(fail_after_audio_ms=300))
+        url = await server.start()
+        translator = _make_translator(url, session_pool_size=1, session_pool_health_interval=0.2)
+        try:
+            translator.start_session_pool()
+            await translator.connect()
+            await translator.start_session()
+            first_session_id = translator.session_id
+
+            for _ in range(200):
+                if translator.session_pool.ready_count:
+                    break
+                await asyncio.sleep(0.01)
+
+            audio = mock.synth_speech_pcm(300)
+            for offset in range(0, len(audio), 3200):
+                await translator.send_audio(audio[offset:offset + 3200])
+            results = await _collect_until(translator, Type.SessionFailed)
+            return first_session_id, translator, results[-1], translator.session_pool.get_stats()
+        finally:
+            await translator.close()
+            await server.stop()
+
+    first_session_id, translator, failed, stats = asyncio.run(scenario())
+
+    assert failed.event == Type.SessionFailed
+    assert failed.error_message == "已自动恢复"
+    assert translator.session_id != first_session_id
+    assert stats["handoffs"] == 2
+    assert stats["prepare_failures"] == 0
+
+
+def test_reader_task_dispatches_typed_events():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config())
+        url = await server.start()
+        translator = _make_translator(url)
+        usage = []
+        try:
+            await translator.connect()
+            await translator.start_session()
+            audio_events = translator.subscribe(EVENT_AUDIO)
+            subtitle_events = translator.subscribe(EVENT_SOURCE_SUBTITLE, EVENT_TRANSLATION_SUBTITLE)
+            lifecycle_events = translator.subscribe(EVENT_LIFECYCLE)
+            translator.add_event_callback(EVENT_USAGE, usage.append)
+            translator.start_reader()
+
+            await _send_sentence(translator)
+            audio = []
+            while True:
+                result = await asyncio.wait_for(audio_events.get(), timeout=5)
+                audio.append(result)
+                if result.event == Type.TTSSentenceEnd:
+                    break
+            subtitles = [subtitle_events.queue.get_nowait() for _ in range(subtitle_events.queue.qsize())]
+            snapshot = translator.get_debug_snapshot()["event_stream"]
+        finally:
+            await translator.close()
+            await server.stop()
+        lifecycle = [lifecycle_events.queue.get_nowait() for _ in range(lifecycle_events.queue.qsize())]
+        return audio, subtitles, lifecycle, usage, snapshot
+
+    audio, subtitles, lifecycle, usage, snapshot = asyncio.run(scenario())
+
+    assert all(r.event in (Type.TTSSentenceStart, Type.TTSResponse, Type.TTSSentenceEnd) for r in audio)
+    assert any(r.audio_data for r in audio)
+    assert subtitles[0].event == Type.SourceSubtitleStart
+    assert Type.TranslationSubtitleEnd in [r.event for r in subtitles]
+    assert [r.event for r in lifecycle if r is not None] == [Type.SessionFinished]
+    assert usage and usage[-1].event == Type.UsageResponse
+    assert snapshot["reader_running"] is True
+    assert snapshot["subscriptions"]["audio"]["delivered"] == len(audio)
+
+
+def test_recovery_replays_audio_from_last_confirmed_sentence():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config(fail_after_audio_ms=1600))
+        url = await server.start()
+        translator = _make_translator(url, replay_buffer_seconds=10, replay_speed=8, retry_delay_base=0.05)
+        try:
+            await translator.connect()
+            await translator.start_session()
+            audio_events = translator.subscribe(EVENT_AUDIO)
+            subtitles = translator.subscribe(EVENT_SOURCE_SUBTITLE)
+            translator.start_reader()
+
+            # 第 1 句完整确认后，第 2 句说到一半时服务端注入 SessionFailed
+            await _send_sentence(translator, speech_ms=600, pause_ms=400)
+            while (await asyncio.wait_for(audio_events.get(), timeout=5)).event != Type.TTSSentenceEnd:
+                pass
+            first_session_id = translator.session_id
+            await _send_sentence(translator, speech_ms=800, pause_ms=400)
+
+            ends = []
+            while len(ends) < 2:
+                result = await asyncio.wait_for(subtitles.get(), timeout=5)
+                if result.event == Type.SourceSubtitleEnd:
+                    ends.append(result)
+            for _ in range(100):
+                if not translator.get_recovery_stats()["replaying"]:
+                    break
+                await asyncio.sleep(0.01)
+            return first_session_id, translator.session_id, ends, translator.get_recovery_stats()
+        finally:
+            await translator.close()
+            await server.stop()
+
+    first_session_id, session_id, ends, stats = asyncio.run(scenario())
+
+    assert session_id != first_session_id
+    assert ends[1].session_id == session_id
+    assert stats["recoveries"] == 1
+    assert stats["last_gap_ms"] > 0
+    # 回放从第 1 句句尾开始，覆盖第 2 句全部音频 (含恢复期间暂存的部分)
+    assert 1.0 <= stats["last_replayed_seconds"] <= 1.6
+    assert stats["lost_seconds_total"] == 0
+
+
+def test_hot_standby_switches_over_without_handshake():
+    async def scenario():
+        server = mock.MockAstServer(_fast_config(fail_after_audio_ms=300))
+        url = await server.start()
+        translator = _make_translator(
+            url, hot_standby=True, hot_standby_keepalive_interval=0.02, retry_delay_base=5.0,
+        )
+        try:
+            translator.start_hot_standby()
+            await translator.connect()
+            await translator.start_session()
+            first_session_id = translator.session_id
+            lifecycle = translator.subscribe(EVENT_LIFECYCLE)
+            translator.start_reader()
+
+            for _ in range(200):
+                stats = translator.hot_standby.get_stats()
+                if stats["ready"] and stats["keepalive_frames"] >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            standby_id = translator.hot_standby.get_stats()["session_id"]
+
+            audio = mock.synth_speech_pcm(300)
+            for offset in range(0, len(audio), 3200):
+                await translator.send_audio(audio[offset:offset + 3200])
+            failed = await asyncio.wait_for(lifecycle.get(), timeout=2)
+            switched_session_id = translator.session_id
+
+            for _ in range(200):
+                if translator.hot_standby.get_stats()["ready"]:
+                    break
+                await asyncio.sleep(0.01)
+            return first_session_id, standby_id, switched_session_id, failed, translator.hot_standby.get_stats()
+        finally:
+            await translator.close()
+            await server.stop()
+
+    first_session_id, standby_id, switched_session_id, failed, stats = asyncio.run(scenario())
+
+    assert failed.event == Type.SessionFailed and failed.error_message == "已自动恢复"
+    assert switched_session_id == standby_id != first_session_id
+    assert stats["switchovers"] == 1
+    # 同一 tick 内切换: 不含任何网络往返或退避 (retry_delay_base=5s)
+    assert stats["last_switchover_ms"] < 50
+    assert stats["ready"] and stats["builds"] == 2
@@ -15,6 +15,27 @@ from typing import Optional, Callable
 import websockets
 from websockets import Headers
 
+from core.session_pool import (
+    PreparedSession,
+    SessionPool,
+    close_connection_quietly,
+    discard_session,
+    is_connection_open,
+)
+from core.audio_framing import AudioFramer
+from core.frame_encoder import TaskRequestEncoder
+from core.replay_buffer import ReplayBuffer
+from core.hot_standby import HotStandby
+from core.event_stream import (
+    EVENT_AUDIO,
+    EVENT_LIFECYCLE,
+    EVENT_SOURCE_SUBTITLE,
+    EVENT_TRANSLATION_SUBTITLE,
+    EVENT_USAGE,
+    EventDispatcher,
+    EventSubscription,
+)
+
 
 
 # NOTE: 不再手动操纵 sys.path。
@@ -89,6 +110,9 @@ except ModuleNotFoundError:
     )
     from pb2.common.events_pb2 import Type
 
+# 恢复后回放时每帧的时长 (ms)
+REPLAY_CHUNK_MS = 200
+
 # 字幕相关事件名称映射，便于日志中直接识别生命周期阶段
 EVENT_NAME_MAP = {
     Type.SessionStarted: "SessionStarted",
@@ -104,6 +128,25 @@ EVENT_NAME_MAP = {
     Type.UsageResponse: "UsageResponse",
 }
 
+SOURCE_SUBTITLE_EVENTS = {
+    Type.SourceSubtitleStart,
+    Type.SourceSubtitleResponse,
+    Type.SourceSubtitleEnd,
+}
+
+TRANSLATION_SUBTITLE_EVENTS = {
+    Type.TranslationSubtitleStart,
+    Type.TranslationSubtitleResponse,
+    Type.TranslationSubtitleEnd,
+}
+
+# TTS 句级起止标记与音频包走同一条流，保持相对顺序
+AUDIO_STREAM_EVENTS = {
+    Type.TTSSentenceStart,
+    Type.TTSSentenceEnd,
+    Type.TTSResponse,
+}
+
 logger.info("✅ 成功导入火山引擎protobuf定义（内部版本）")
 
 
@@ -127,6 +170,20 @@ class TranslationResult:
     is_finished: bool = False
     is_failed: bool = False
     error_message: str = ""
+    received_at: float = 0.0  # 收到响应帧的 perf_counter 时间
+
+
+def classify_event(result: TranslationResult) -> str:
+    """返回结果所属的事件类别 (见 core.event_stream)。"""
+    if result.audio_data or result.event in AUDIO_STREAM_EVENTS:
+        return EVENT_AUDIO
+    if result.event in SOURCE_SUBTITLE_EVENTS:
+        return EVENT_SOURCE_SUBTITLE
+    if result.event in TRANSLATION_SUBTITLE_EVENTS:
+        return EVENT_TRANSLATION_SUBTITLE
+    if result.event == Type.UsageResponse:
+        return EVENT_USAGE
+    return EVENT_LIFECYCLE
 
 
 class VolcengineTranslator:
@@ -144,7 +201,17 @@ class VolcengineTranslator:
         auto_reconnect: bool = True,
         max_retry_attempts: int = 3,
         retry_delay_base: float = 1.0,
-        failure_callback: Optional[Callable] = None
+        failure_callback: Optional[Callable] = None,
+        session_pool_size: int = 0,
+        session_pool_max_idle: float = 30.0,
+        session_pool_health_interval: float = 5.0,
+        frame_ms: Optional[int] = None,
+        frame_max_hold_ms: Optional[int] = None,
+        replay_buffer_seconds: float = 0.0,
+        replay_speed: float = 4.0,
+        hot_standby: bool = False,
+        hot_standby_keepalive_interval: float = 0.5,
+        hot_standby_keepalive_ms: int = 20,
     ):
         """
         初始化翻译客户端
@@ -161,6 +228,16 @@ class VolcengineTranslator:
             max_retry_attempts: 最大重试次数 (默认3)
             retry_delay_base: 重试基础延迟(秒) (默认1.0, 使用指数退避)
             failure_callback: 失败回调函数(重试失败后调用)
+            session_pool_size: 预热会话数 (0=禁用预热池)
+            session_pool_max_idle: 预热会话最长闲置时间(秒)，超时淘汰重建
+            session_pool_health_interval: 预热会话健康检查间隔(秒)
+            frame_ms: 上行帧目标时长(ms)，None 表示每次 send_audio 直接成帧
+            frame_max_hold_ms: 上行样本最长滞留时间(ms)，默认等于 frame_ms
+            replay_buffer_seconds: 上行回放缓冲时长(秒)，0 表示恢复后不回放
+            replay_speed: 恢复后回放的倍速 (相对实时)
+            hot_standby: 是否常驻一条热备会话，主会话失败时立即切换
+            hot_standby_keepalive_interval: 热备静音保活间隔(秒)
+            hot_standby_keepalive_ms: 每次保活发送的静音时长(ms)
         """
         self.config = config
         self.mode = mode
@@ -177,14 +254,86 @@ class VolcengineTranslator:
         self.conn = None
         self.session_id = None
         self.is_connected = False
+        self._session_active_event = asyncio.Event()
+        self._session_inactive_event = asyncio.Event()
         self.is_session_active = False
 
+        # 常驻接收任务: 每个响应只解析一次，按类别分发到订阅队列/回调
+        self.events = EventDispatcher()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._reader_frames = 0
+
+        # 会话预热池: 启动和恢复时直接接管已握手的会话
+        self.session_pool: Optional[SessionPool] = None
+        if session_pool_size > 0:
+            self.session_pool = SessionPool(
+                factory=self.prepare_session,
+                size=session_pool_size,
+                max_idle_seconds=session_pool_max_idle,
+                health_check_interval=session_pool_health_interval,
+                name=f"{source_language}→{target_language}",
+            )
+        self._staged_session: Optional[PreparedSession] = None
+        self._task_encoder: Optional[TaskRequestEncoder] = None
+
         # 音频格式配置
         self.source_audio_format = "wav"
         self.source_audio_rate = 16000
         self.source_audio_bits = 16
         self.source_audio_channel = 1
 
+        # 会话恢复: 恢复期间暂存上行音频，恢复后从最后确认的句子边界回放
+        bytes_per_second = self.source_audio_rate * self.source_audio_bits // 8 * self.source_audio_channel
+        self.replay_buffer: Optional[ReplayBuffer] = None
+        if replay_buffer_seconds > 0:
+            self.replay_buffer = ReplayBuffer(
+                max_seconds=replay_buffer_seconds,
+                bytes_per_second=bytes_per_second,
+                frame_align=self.source_audio_bits // 8 * self.source_audio_channel,
+            )
+        self.replay_speed = max(1.0, replay_speed)
+        self._recovering = False
+        self._replaying = False
+        self._replay_task: Optional[asyncio.Task] = None
+        self._session_stream_base = 0
+        self._pending_boundary_offset: Optional[int] = None
+        self._confirmed_boundary_offset = 0
+        self._adopted_preroll_bytes = 0
+        self._sentence_done_event = Type.TTSSentenceEnd if mode == "s2s" else Type.TranslationSubtitleEnd
+        self._recovery_stats = {
+            "recoveries": 0,
+            "last_gap_ms": 0.0,
+            "max_gap_ms": 0.0,
+            "last_replayed_seconds": 0.0,
+            "replayed_seconds_total": 0.0,
+            "last_replay_ms": 0.0,
+            "lost_seconds_total": 0.0,
+        }
+
+        # 热备会话: 主会话失败时同一 tick 内切换，不经过退避和握手
+        self.hot_standby: Optional[HotStandby] = None
+        if hot_standby:
+            self.hot_standby = HotStandby(
+                factory=self.prepare_session,
+                encode_frame=self._encode_task_frame,
+                is_terminal_response=self._is_terminal_response,
+                keepalive_interval=hot_standby_keepalive_interval,
+                keepalive_audio_ms=hot_standby_keepalive_ms,
+                bytes_per_ms=bytes_per_second // 1000,
+                name=f"{source_language}→{target_language}",
+            )
+
+        # 上行分帧: 按时长合并/拆分采集块，由 flush_audio() 兑现滞留时限
+        self.audio_framer: Optional[AudioFramer] = None
+        if frame_ms:
+            self.audio_framer = AudioFramer(
+                sample_rate=self.source_audio_rate,
+                sample_width=self.source_audio_bits // 8,
+                channels=self.source_audio_channel,
+                frame_ms=frame_ms,
+                max_hold_ms=frame_max_hold_ms,
+            )
+
         self.target_audio_format = target_audio_format
         self.target_audio_rate = target_audio_rate
         self._pending_first_audio_packet_validation = True
@@ -197,6 +346,20 @@ class VolcengineTranslator:
         self._debug_last_audio_time = None
         self._debug_first_audio_time = None
 
+    @property
+    def is_session_active(self) -> bool:
+        return self._session_active
+
+    @is_session_active.setter
+    def is_session_active(self, value: bool):
+        self._session_active = value
+        if value:
+            self._session_inactive_event.clear()
+            self._session_active_event.set()
+        else:
+            self._session_active_event.clear()
+            self._session_inactive_event.set()
+
     def _record_audio_packet_debug(self, event: int, sequence: int, audio_size: int):
         """记录音频回包诊断信息，供主线程聚合输出。"""
         now = time.perf_counter()
@@ -230,6 +393,15 @@ class VolcengineTranslator:
             "last_audio_event": self._debug_last_audio_event,
             "last_audio_delta_ms": round(self._debug_last_audio_delta_ms, 1),
             "estimated_audio_seconds": round(estimated_audio_seconds, 2),
+            "session_pool": self.session_pool.get_stats() if self.session_pool else None,
+            "upstream": self.audio_framer.get_stats() if self.audio_framer else None,
+            "recovery": self.get_recovery_stats(),
+            "hot_standby": self.hot_standby.get_stats() if self.hot_standby else None,
+            "event_stream": {
+                "reader_running": self.is_reader_running,
+                "frames": self._reader_frames,
+                **self.events.get_stats(),
+            },
         }
 
     def _validate_first_audio_packet(self, data: bytes) -> bool:
@@ -245,12 +417,32 @@ class VolcengineTranslator:
 
         return True
 
-    async def connect(self):
-        """建立WebSocket连接"""
-        if self.is_connected:
-            logger.warning("⚠️  已存在WebSocket连接")
-            return
-
+    def start_session_pool(self):
+        """启动会话预热池 (未启用时忽略)，需在事件循环中调用。"""
+        if self.session_pool:
+            self.session_pool.start()
+
+    def start_hot_standby(self):
+        """启动热备会话维护 (未启用时忽略)，需在事件循环中调用。"""
+        if self.hot_standby:
+            self.hot_standby.start()
+
+    def _encode_task_frame(self, session_id: str, audio_data: bytes) -> bytes:
+        """为任意会话编码一帧 TaskRequest (热备保活使用)。"""
+        request = TranslateRequest()
+        request.request_meta.SessionID = session_id
+        request.event = Type.TaskRequest
+        return TaskRequestEncoder(session_id, request.SerializeToString()).encode(audio_data)
+
+    @staticmethod
+    def _is_terminal_response(data: bytes) -> bool:
+        """响应是否表示会话已结束 (失败/取消/完成)。"""
+        response = TranslateResponse()
+        response.ParseFromString(data)
+        return response.event in (Type.SessionFailed, Type.SessionCanceled, Type.SessionFinished)
+
+    async def _open_connection(self):
+        """建立一条带认证头的 WebSocket 连接，返回 (conn, log_id)。"""
         try:
             conn_id = str(uuid.uuid4())
             headers = Headers({
@@ -260,21 +452,20 @@ class VolcengineTranslator:
                 "X-Api-Connect-Id": conn_id
             })
 
-            self.conn = await websockets.connect(
+            conn = await websockets.connect(
                 self.config.ws_url,
                 additional_headers=headers,  # websockets 14+ (旧版用 extra_headers)
                 max_size=1000000000,
                 ping_interval=None
             )
 
-            self.is_connected = True
             # websockets 14+ 使用 conn.response.headers;13.x 使用 conn.response_headers
             try:
-                resp_headers = self.conn.response.headers  # websockets 14+
+                resp_headers = conn.response.headers  # websockets 14+
             except AttributeError:
-                resp_headers = getattr(self.conn, 'response_headers', {})
+                resp_headers = getattr(conn, 'response_headers', {})
             log_id = resp_headers.get('X-Tt-Logid', 'unknown') if resp_headers else 'unknown'
-            logger.info(f"✅ WebSocket已连接 (LogID: {log_id})")
+            return conn, log_id
 
         except Exception as e:
             logger.error(f"❌ WebSocket连接失败: {e}")
@@ -292,6 +483,103 @@ class VolcengineTranslator:
                 pass
             raise
 
+    async def connect(self):
+        """建立WebSocket连接"""
+        if self.is_connected:
+            logger.warning("⚠️  已存在WebSocket连接")
+            return
+
+        # 预热池中有就绪会话时直接接管，start_session() 无需再握手
+        if self.session_pool:
+            prepared = await self.session_pool.acquire()
+            if prepared:
+                self._staged_session = prepared
+                self.conn = prepared.conn
+                self.is_connected = True
+                logger.info(f"✅ WebSocket已连接 (预热, LogID: {prepared.log_id})")
+                return
+
+        self.conn, log_id = await self._open_connection()
+        self.is_connected = True
+        logger.info(f"✅ WebSocket已连接 (LogID: {log_id})")
+
+    def _build_start_request(self, session_id: str) -> TranslateRequest:
+        """构建StartSession请求"""
+        request = TranslateRequest()
+        request.request_meta.SessionID = session_id
+        request.event = Type.StartSession
+        request.user.uid = "realtime_translator"
+        request.user.did = "realtime_translator"
+
+        # 源音频配置
+        request.source_audio.format = self.source_audio_format
+        request.source_audio.rate = self.source_audio_rate
+        request.source_audio.bits = self.source_audio_bits
+        request.source_audio.channel = self.source_audio_channel
+
+        # 目标音频配置(仅s2s模式需要)
+        if self.mode == "s2s":
+            request.target_audio.format = self.target_audio_format
+            request.target_audio.rate = self.target_audio_rate
+            if self.target_audio_format == "pcm":
+                request.target_audio.bits = 16
+                request.target_audio.channel = 1
+
+        # 翻译参数
+        request.request.mode = self.mode
+        request.request.source_language = self.source_language
+        request.request.target_language = self.target_language
+        return request
+
+    async def _handshake(self, conn, session_id: str):
+        """在指定连接上发送StartSession并等待SessionStarted"""
+        request = self._build_start_request(session_id)
+        await conn.send(request.SerializeToString())
+
+        response_data = await conn.recv()
+        response = TranslateResponse()
+        response.ParseFromString(response_data)
+
+        if response.event != Type.SessionStarted:
+            error_msg = f"会话启动失败: {response.response_meta.Message}"
+            logger.error(f"❌ {error_msg}")
+            raise RuntimeError(error_msg)
+
+    async def prepare_session(self) -> PreparedSession:
+        """新建连接并启动会话，返回待接管的就绪会话 (供预热池调用)。"""
+        started = time.perf_counter()
+        conn, log_id = await self._open_connection()
+        session_id = str(uuid.uuid4())
+        try:
+            await self._handshake(conn, session_id)
+        except BaseException:
+            await conn.close()
+            raise
+        return PreparedSession(
+            conn=conn,
+            session_id=session_id,
+            log_id=log_id,
+            prepare_seconds=time.perf_counter() - started,
+        )
+
+    def _adopt_session(self, prepared: PreparedSession):
+        """把就绪会话切换为当前会话 (同步完成，不经过网络往返)。"""
+        self.conn = prepared.conn
+        self.session_id = prepared.session_id
+        self.is_connected = True
+        self.is_session_active = True
+        self._pending_first_audio_packet_validation = True
+        self._adopted_preroll_bytes = prepared.audio_bytes_sent
+        self._mark_session_stream_start()
+
+    def _mark_session_stream_start(self):
+        """新会话的服务端时间 0 对应回放缓冲的当前末尾 (扣除接管前已发送的保活静音)。"""
+        if self.replay_buffer is None:
+            return
+        self._session_stream_base = self.replay_buffer.end_offset - self._adopted_preroll_bytes
+        self._confirmed_boundary_offset = self._session_stream_base
+        self._pending_boundary_offset = None
+
     async def start_session(self):
         """启动翻译会话"""
         if not self.is_connected:
@@ -301,34 +589,16 @@ class VolcengineTranslator:
             logger.warning("⚠️  会话已启动")
             return
 
+        staged, self._staged_session = self._staged_session, None
+        if staged and staged.conn is self.conn:
+            self._adopt_session(staged)
+            logger.info(f"✅ 翻译会话已启动 (预热, ID: {self.session_id})")
+            logger.info(f"   模式: {self.mode}, {self.source_language}→{self.target_language}")
+            return
+
         try:
             self.session_id = str(uuid.uuid4())
-
-            # 构建StartSession请求
-            request = TranslateRequest()
-            request.request_meta.SessionID = self.session_id
-            request.event = Type.StartSession
-            request.user.uid = "realtime_translator"
-            request.user.did = "realtime_translator"
-
-            # 源音频配置
-            request.source_audio.format = self.source_audio_format
-            request.source_audio.rate = self.source_audio_rate
-            request.source_audio.bits = self.source_audio_bits
-            request.source_audio.channel = self.source_audio_channel
-
-            # 目标音频配置(仅s2s模式需要)
-            if self.mode == "s2s":
-                request.target_audio.format = self.target_audio_format
-                request.target_audio.rate = self.target_audio_rate
-                if self.target_audio_format == "pcm":
-                    request.target_audio.bits = 16
-                    request.target_audio.channel = 1
-
-            # 翻译参数
-            request.request.mode = self.mode
-            request.request.source_language = self.source_language
-            request.request.target_language = self.target_language
+            request = self._build_start_request(self.session_id)
 
             # 🔍 调试日志: 会话配置
             logger.info(f"🔧 [Session启动配置]")
@@ -353,21 +623,13 @@ class VolcengineTranslator:
             logger.debug(f"   request.request.mode = {request.request.mode}")
             logger.debug(f"   request序列化大小: {len(request.SerializeToString())} bytes")
 
-            # 发送请求
-            await self.conn.send(request.SerializeToString())
-
-            # 接收响应
-            response_data = await self.conn.recv()
-            response = TranslateResponse()
-            response.ParseFromString(response_data)
-
-            if response.event != Type.SessionStarted:
-                error_msg = f"会话启动失败: {response.response_meta.Message}"
-                logger.error(f"❌ {error_msg}")
-                raise RuntimeError(error_msg)
+            # 发送请求并等待SessionStarted
+            await self._handshake(self.conn, self.session_id)
 
             self.is_session_active = True
             self._pending_first_audio_packet_validation = True
+            self._adopted_preroll_bytes = 0
+            self._mark_session_stream_start()
             logger.info(f"✅ 翻译会话已启动 (ID: {self.session_id})")
             logger.info(f"   模式: {self.mode}, {self.source_language}→{self.target_language}")
 
@@ -379,19 +641,65 @@ class VolcengineTranslator:
         """
         发送音频数据
 
+        启用分帧时数据先进入分帧器，凑满目标时长才实际发送；
+        调用方需配合 flush_audio() 兑现滞留时限。
+
         Args:
             audio_data: 音频字节流
         """
-        if not self.is_session_active:
+        if not self.is_session_active and not self._recovering:
             raise RuntimeError("会话未启动")
 
-        try:
+        if self.audio_framer is None:
+            await self._send_audio_frame(audio_data)
+            return
+
+        for frame in self.audio_framer.push(audio_data):
+            await self._send_audio_frame(frame)
+
+    async def flush_audio(self, force: bool = False):
+        """
+        发送分帧器中滞留到期的数据
+
+        Args:
+            force: True 时无视时限，发出全部剩余数据
+        """
+        if self.audio_framer is None or not (self.is_session_active or self._recovering):
+            return
+        frame = self.audio_framer.flush() if force else self.audio_framer.poll()
+        if frame:
+            await self._send_audio_frame(frame)
+
+    def audio_flush_timeout(self, default: float) -> float:
+        """采集循环的等待超时: 不晚于分帧器中最早样本的发送时限。"""
+        if self.audio_framer is None:
+            return default
+        remaining = self.audio_framer.time_until_deadline()
+        return default if remaining is None else min(default, remaining)
+
+    def _get_task_encoder(self) -> TaskRequestEncoder:
+        """返回当前会话的 TaskRequest 编码器，会话切换后按新 SessionID 重建前缀。"""
+        encoder = self._task_encoder
+        if encoder is None or encoder.session_id != self.session_id:
             request = TranslateRequest()
             request.request_meta.SessionID = self.session_id
             request.event = Type.TaskRequest
-            request.source_audio.binary_data = audio_data
+            encoder = TaskRequestEncoder(self.session_id, request.SerializeToString())
+            self._task_encoder = encoder
+        return encoder
+
+    async def _send_audio_frame(self, audio_data: bytes):
+        """把一帧音频封装为 TaskRequest 发出；恢复或回放期间只写入回放缓冲"""
+        if self.replay_buffer is not None:
+            self.replay_buffer.append(audio_data)
+            if self._replaying or not self.is_session_active:
+                return
+        elif not self.is_session_active:
+            # 未启用回放: 恢复期间的音频直接丢弃
+            return
 
-            await self.conn.send(request.SerializeToString())
+        try:
+            await self.conn.send(self._get_task_encoder().encode(audio_data))
 
         except Exception as e:
             logger.error(f"❌ 发送音频失败: {e}")
@@ -409,6 +717,7 @@ class VolcengineTranslator:
 
         try:
             response_data = await self.conn.recv()
+            received_at = time.perf_counter()
             response = TranslateResponse()
             response.ParseFromString(response_data)
 
@@ -447,9 +756,13 @@ class VolcengineTranslator:
                 audio_data=response.data if response.data else b"",
                 is_finished=(response.event == Type.SessionFinished),
                 is_failed=(response.event in [Type.SessionFailed, Type.SessionCanceled]),
-                error_message=response.response_meta.Message if response.response_meta.Message else ""
+                error_message=response.response_meta.Message if response.response_meta.Message else "",
+                received_at=received_at,
             )
 
+            if self.replay_buffer is not None:
+                self._track_sentence_boundary(response)
+
             if result.audio_data:
                 self._record_audio_packet_debug(
                     event=result.event,
@@ -479,7 +792,7 @@ class VolcengineTranslator:
                 # 🆕 自动重连逻辑
                 if self.auto_reconnect:
                     logger.warning("🔄 启动自动恢复...")
-                    recovery_success = await self._attempt_recovery(result.error_message)
+                    recovery_success = await self._attempt_recovery(result.error_message, failed_at=received_at)
 
                     if recovery_success:
                         logger.info("✅ 自动恢复成功,会话已重启")
@@ -501,6 +814,85 @@ class VolcengineTranslator:
             logger.error(f"❌ 接收结果失败: {e}")
             return None
 
+    def subscribe(self, *kinds: str, name: Optional[str] = None) -> EventSubscription:
+        """
+        订阅一类或多类事件 (见 core.event_stream.EVENT_*)
+
+        需在 start_reader() 之前调用，否则可能错过早到的事件。
+        """
+        return self.events.subscribe(*kinds, name=name)
+
+    def add_event_callback(self, kind: str, callback: Callable):
+        """注册事件回调，由接收任务同步调用。"""
+        self.events.add_callback(kind, callback)
+
+    def wake_subscribers(self):
+        """唤醒所有阻塞在订阅队列上的消费者 (停止时使用)。"""
+        self.events.wake_all()
+
+    @property
+    def is_reader_running(self) -> bool:
+        return self._reader_task is not None and not self._reader_task.done()
+
+    def start_reader(self):
+        """启动常驻接收任务；启动后不得再直接调用 receive_result()。"""
+        if self.is_reader_running:
+            return
+        self._reader_task = asyncio.create_task(self._reader_loop())
+
+    async def stop_reader(self):
+        """停止接收任务并唤醒所有订阅者。"""
+        task, self._reader_task = self._reader_task, None
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self.wake_subscribers()
+
+    async def _reader_loop(self):
+        """持续读取响应并按类别分发；会话未激活时等待而不是轮询。"""
+        logger.info("📡 接收任务已启动")
+        try:
+            while True:
+                if not self.is_session_active:
+                    await self._session_active_event.wait()
+                    continue
+
+                result = await self.receive_result()
+                if result is None:
+                    if self.is_session_active and not is_connection_open(self.conn):
+                        await self._handle_connection_lost()
+                    continue
+
+                self._reader_frames += 1
+                self.events.dispatch(classify_event(result), result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 接收任务异常退出: {e}")
+        finally:
+            self.wake_subscribers()
+
+    async def _handle_connection_lost(self):
+        """连接在会话进行中断开: 尝试恢复，失败时向 lifecycle 订阅者报告。"""
+        error = "connection closed"
+        failed_at = time.perf_counter()
+        logger.error(f"❌ WebSocket连接已断开 (会话 {self.session_id})")
+        self.is_session_active = False
+        self.is_connected = False
+
+        if self.auto_reconnect and await self._attempt_recovery(error, failed_at=failed_at):
+            logger.info("✅ 自动恢复成功,会话已重启")
+            return
+
+        self.events.dispatch(EVENT_LIFECYCLE, TranslationResult(
+            event=Type.SessionFailed,
+            session_id=self.session_id or "",
+            sequence=0,
+            is_failed=True,
+            error_message=error,
+            received_at=time.perf_counter(),
+        ))
+
     def _should_retry(self, error_msg: str) -> bool:
         """
         判断错误是否应该重试
@@ -530,12 +922,47 @@ class VolcengineTranslator:
         logger.warning(f"⚠️  未知错误类型,默认不重试: {error_msg}")
         return False
 
-    async def _attempt_recovery(self, error: str) -> bool:
+    def _track_sentence_boundary(self, response):
+        """
+        跟踪已确认的句子边界 (回放起点)
+
+        SourceSubtitleEnd 给出句尾的会话内时间，待该句译文/TTS 完整下发后才确认，
+        保证回放不会跳过尚未拿到结果的句子。
+        """
+        if response.event == Type.SourceSubtitleEnd:
+            if response.end_time > 0:
+                offset = self._session_stream_base + self.replay_buffer.ms_to_bytes(response.end_time)
+            else:
+                offset = self.replay_buffer.end_offset
+            self._pending_boundary_offset = min(offset, self.replay_buffer.end_offset)
+        elif response.event == self._sentence_done_event and self._pending_boundary_offset is not None:
+            self._confirmed_boundary_offset = max(self._confirmed_boundary_offset, self._pending_boundary_offset)
+            self._pending_boundary_offset = None
+
+    def get_recovery_stats(self) -> dict:
+        """返回会话恢复与回放统计。"""
+        stats = {key: round(value, 3) if isinstance(value, float) else value
+                 for key, value in self._recovery_stats.items()}
+        stats["replay_enabled"] = self.replay_buffer is not None
+        stats["replaying"] = self._replaying
+        if self.replay_buffer is not None:
+            stats["buffered_seconds"] = round(self.replay_buffer.buffered_seconds, 2)
+            stats["unconfirmed_seconds"] = round(
+                (self.replay_buffer.end_offset - self._confirmed_boundary_offset)
+                / self.replay_buffer.bytes_per_second, 2
+            )
+        return stats
+
+    async def _attempt_recovery(self, error: str, failed_at: Optional[float] = None) -> bool:
         """
         尝试恢复会话(自动重连)
 
+        恢复期间 send_audio() 不再报错，音频暂存到回放缓冲；
+        恢复成功后从最后确认的句子边界开始加速回放。
+
         Args:
             error: 错误消息
+            failed_at: 发现失败的 perf_counter 时间 (默认为当前时间)
 
         Returns:
             是否恢复成功
@@ -545,8 +972,106 @@ class VolcengineTranslator:
             logger.error(f"❌ 错误不可重试,放弃恢复")
             return False
 
+        started = failed_at or time.perf_counter()
+        # 新会话启动时会重置边界，需在重启前记下回放起点
+        replay_from = self._confirmed_boundary_offset
+        self._recovering = True
+        try:
+            recovered = await self._restart_session(error, failed_at=started)
+            if recovered:
+                self._on_session_recovered(started, replay_from)
+            return recovered
+        finally:
+            self._recovering = False
+
+    def _on_session_recovered(self, started: float, replay_from: int):
+        """记录恢复间隔，并在新会话上启动回放 (同步完成，避免与实时发送交错)。"""
+        gap_ms = (time.perf_counter() - started) * 1000
+        stats = self._recovery_stats
+        stats["recoveries"] += 1
+        stats["last_gap_ms"] = gap_ms
+        stats["max_gap_ms"] = max(stats["max_gap_ms"], gap_ms)
+
+        if self.replay_buffer is None:
+            logger.info(f"⏱️  恢复间隔 {gap_ms:.0f}ms (未启用回放，期间音频已丢弃)")
+            return
+
+        lost_bytes = max(0, self.replay_buffer.start_offset - replay_from)
+        replay_from = max(replay_from, self.replay_buffer.start_offset)
+        if lost_bytes:
+            stats["lost_seconds_total"] += lost_bytes / self.replay_buffer.bytes_per_second
+            logger.warning(f"⚠️  回放缓冲不足，{lost_bytes / self.replay_buffer.bytes_per_second:.2f}s 音频无法回放")
+
+        # 新会话的时间 0 对应回放起点 (热备会话需扣除已发送的保活静音)
+        self._session_stream_base = replay_from - self._adopted_preroll_bytes
+        self._confirmed_boundary_offset = replay_from
+        self._pending_boundary_offset = None
+
+        pending_seconds = (self.replay_buffer.end_offset - replay_from) / self.replay_buffer.bytes_per_second
+        logger.info(f"⏱️  恢复间隔 {gap_ms:.0f}ms，从句子边界回放 {pending_seconds:.2f}s 音频 ({self.replay_speed:.1f}x)")
+
+        self._replaying = True
+        self._replay_task = asyncio.create_task(self._replay_from(replay_from))
+
+    async def _replay_from(self, offset: int):
+        """把回放缓冲中 offset 之后的音频按倍速发往当前会话，追上实时后交还给 send_audio。"""
+        buffer = self.replay_buffer
+        chunk_bytes = buffer.ms_to_bytes(REPLAY_CHUNK_MS)
+        started = time.perf_counter()
+        replayed = 0
+        position = offset
+        try:
+            while self.is_session_active:
+                start, data = buffer.read_from(position, max_bytes=chunk_bytes)
+                if not data:
+                    break
+                await self.conn.send(self._get_task_encoder().encode(data))
+                position = start + len(data)
+                replayed += len(data)
+
+                # 按倍速节流，同时受 WebSocket 发送背压约束
+                delay = started + replayed / buffer.bytes_per_second / self.replay_speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 回放音频失败: {e}")
+        finally:
+            self._replaying = False
+            replayed_seconds = replayed / buffer.bytes_per_second
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._recovery_stats["last_replayed_seconds"] = replayed_seconds
+            self._recovery_stats["replayed_seconds_total"] += replayed_seconds
+            self._recovery_stats["last_replay_ms"] = elapsed_ms
+            logger.info(f"⏩ 回放完成: {replayed_seconds:.2f}s 音频，用时 {elapsed_ms:.0f}ms")
+
+    async def _restart_session(self, error: str, failed_at: float) -> bool:
+        """重启会话: 依次尝试热备会话、预热会话，最后按指数退避重连。"""
+        # 热备会话: 同步接管，不让出事件循环
+        if self.hot_standby:
+            standby = self.hot_standby.take(failed_at=failed_at)
+            if standby:
+                old_conn = self.conn
+                self._adopt_session(standby)
+                if old_conn is not None and old_conn is not standby.conn:
+                    asyncio.create_task(close_connection_quietly(old_conn))
+                logger.info(f"✅ 会话恢复成功! (热备会话 ID: {self.session_id})")
+                return True
+
         logger.info(f"🔄 开始自动恢复流程...")
 
+        # 预热池有就绪会话时立即切换，跳过退避与握手
+        if self.session_pool:
+            prepared = self.session_pool.acquire_nowait()
+            if prepared:
+                old_conn = self.conn
+                self._adopt_session(prepared)
+                if old_conn is not None and old_conn is not prepared.conn:
+                    asyncio.create_task(close_connection_quietly(old_conn))
+                logger.info(f"✅ 会话恢复成功! (预热会话 ID: {self.session_id})")
+                return True
+
         for attempt in range(1, self.max_retry_attempts + 1):
             try:
                 # 指数退避延迟
@@ -559,8 +1084,9 @@ class VolcengineTranslator:
                 await asyncio.sleep(delay)
 
                 # 检查WebSocket是否还连接
-                if not self.is_connected or not self.conn:
+                if not is_connection_open(self.conn):
                     logger.info("🔌 重新建立WebSocket连接...")
+                    self.is_connected = False
                     await self.connect()
 
                 # 重启会话
@@ -595,6 +1121,8 @@ class VolcengineTranslator:
             return
 
         try:
+            await self.flush_audio(force=True)
+
             request = TranslateRequest()
             request.request_meta.SessionID = self.session_id
             request.event = Type.FinishSession
@@ -602,7 +1130,11 @@ class VolcengineTranslator:
             await self.conn.send(request.SerializeToString())
             logger.info("📤 已发送FinishSession请求")
 
-            # 等待会话结束响应
+            # 等待会话结束响应: 接收任务运行时由它处理，否则在此直接读取
+            if self.is_reader_running:
+                await asyncio.wait_for(self._session_inactive_event.wait(), timeout=10.0)
+                return
+
             while self.is_session_active:
                 result = await self.receive_result()
                 if result and (result.is_finished or result.is_failed):
@@ -613,9 +1145,26 @@ class VolcengineTranslator:
 
     async def close(self):
         """关闭连接"""
+        if self.session_pool:
+            await self.session_pool.close()
+
+        if self.hot_standby:
+            await self.hot_standby.close()
+
+        if self._staged_session:
+            staged, self._staged_session = self._staged_session, None
+            if staged.conn is not self.conn:
+                await discard_session(staged)
+
         if self.is_session_active:
             await self.finish_session()
 
+        await self.stop_reader()
+
+        if self._replay_task and not self._replay_task.done():
+            self._replay_task.cancel()
+            await asyncio.gather(self._replay_task, return_exceptions=True)
+
         if self.is_connected and self.conn:
             await self.conn.close()
             self.is_connected = False
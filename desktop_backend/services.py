@@ -24,6 +24,22 @@ DEFAULT_CONFIG = {
         "app_key": "",
         "access_key": "",
         "resource_id": "volc.service_type.10053",
+        "recovery_replay": {
+            "enabled": True,
+            "max_seconds": 30,
+            "speed": 4.0,
+        },
+        "hot_standby": {
+            "enabled": False,
+            "keepalive_interval_ms": 500,
+            "keepalive_audio_ms": 20,
+        },
+        "session_pool": {
+            "enabled": True,
+            "size": 1,
+            "max_idle_seconds": 30,
+            "health_check_interval": 5,
+        },
     },
     "audio": {
         "microphone": {
@@ -39,6 +55,12 @@ DEFAULT_CONFIG = {
             "channels": 1,
             "chunk_size": 1600,
         },
+        "framing": {
+            "frame_ms": 100,
+            "max_hold_ms": None,
+            "low_latency": False,
+            "capture_block_ms": None,
+        },
         "vbcable_output": {
             "device": "",
             "sample_rate": 48000,
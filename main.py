@@ -261,6 +261,7 @@ class DualChannelTranslator:
         """初始化所有组件"""
         import sounddevice as sd  # 延迟导入: 避免顶层加载 C 扩展
         from core.audio_capture import AudioCapturer
+        from core.audio_framing import FramingConfig
         from core.audio_output import OggOpusPlayer, PcmStreamPlayer
         from core.system_audio_capture import SystemAudioCapturer
 
@@ -270,13 +271,24 @@ class DualChannelTranslator:
         ch1_log.info("初始化输入设备...")
         audio_config = self.config['audio']
 
+        # 上行分帧: 采集块大小由分帧配置决定，低延迟模式使用小块采集
+        self.framing_config = FramingConfig.from_dict(audio_config.get('framing'))
+        capture_chunk_size = self.framing_config.capture_chunk_size(16000)
+        sys_log.info(
+            "上行分帧: 目标帧=%dms 最长滞留=%dms 采集块=%dms%s",
+            self.framing_config.frame_ms,
+            self.framing_config.effective_max_hold_ms,
+            self.framing_config.effective_capture_block_ms,
+            " (低延迟模式)" if self.framing_config.low_latency else "",
+        )
+
         self.mic_capturer = None
         if self.channel1_enabled:
             self.mic_capturer = AudioCapturer(
                 device_name=audio_config['microphone']['device'],
                 sample_rate=16000,
                 channels=1,
-                chunk_size=1600  # 100ms @ 16kHz
+                chunk_size=capture_chunk_size
             )
             ch1_log.info("麦克风捕获器已初始化")
         else:
@@ -291,7 +303,7 @@ class DualChannelTranslator:
             fallback_device=system_audio_config['fallback_device'],
             sample_rate=16000,
             channels=1,
-            chunk_size=1600
+            chunk_size=capture_chunk_size
         )
         ch2_log.info("系统音频捕获器已初始化")
 
@@ -393,6 +405,7 @@ class DualChannelTranslator:
             access_key=self.config['volcengine']['access_key'],
             resource_id=self.config['volcengine'].get('resource_id', 'volc.service_type.10053')
         )
+        translator_kwargs = self._translator_common_kwargs()
 
         # Channel 1: 中文 → 英文 (s2s)
         channels_config = self.config.get('channels', {})
@@ -411,6 +424,7 @@ class DualChannelTranslator:
                 target_language=ch1_config.get('target_language', 'en'),
                 target_audio_format=ch1_target_format,
                 target_audio_rate=ch1_target_rate,
+                **translator_kwargs,
             )
             ch1_log.info("翻译器已初始化: 中文 → 英文 (s2s)")
         else:
@@ -425,7 +439,8 @@ class DualChannelTranslator:
                 config=volcengine_cfg,
                 mode=ch2_config.get('mode', 's2t'),  # speech to text!
                 source_language=ch2_config.get('source_language', 'en'),
-                target_language=ch2_config.get('target_language', 'zh')
+                target_language=ch2_config.get('target_language', 'zh'),
+                **translator_kwargs,
             )
             ch2_log.info("翻译器已初始化: 英文 → 中文 (s2t)")
         else:
@@ -434,12 +449,56 @@ class DualChannelTranslator:
 
         sys_log.info("所有组件初始化完成")
 
+    def _translator_common_kwargs(self) -> dict:
+        """两个方向共用的翻译客户端参数 (来自 volcengine 配置段)"""
+        volcengine_config = self.config.get('volcengine', {})
+        kwargs = {
+            'frame_ms': self.framing_config.frame_ms,
+            'frame_max_hold_ms': self.framing_config.effective_max_hold_ms,
+        }
+
+        replay_config = volcengine_config.get('recovery_replay') or {}
+        if replay_config.get('enabled', False):
+            kwargs.update(
+                replay_buffer_seconds=float(replay_config.get('max_seconds', 30.0)),
+                replay_speed=float(replay_config.get('speed', 4.0)),
+            )
+
+        standby_config = volcengine_config.get('hot_standby') or {}
+        if standby_config.get('enabled', False):
+            kwargs.update(
+                hot_standby=True,
+                hot_standby_keepalive_interval=float(standby_config.get('keepalive_interval_ms', 500)) / 1000,
+                hot_standby_keepalive_ms=int(standby_config.get('keepalive_audio_ms', 20)),
+            )
+            sys_log.info("热备会话已启用: 每方向常驻 1 路备用会话")
+
+        pool_config = volcengine_config.get('session_pool') or {}
+        if pool_config.get('enabled', False):
+            kwargs.update(
+                session_pool_size=int(pool_config.get('size', 1)),
+                session_pool_max_idle=float(pool_config.get('max_idle_seconds', 30.0)),
+                session_pool_health_interval=float(pool_config.get('health_check_interval', 5.0)),
+            )
+            sys_log.info(
+                "会话预热池已启用: 每方向 %d 个, 闲置上限 %.0fs",
+                kwargs['session_pool_size'], kwargs['session_pool_max_idle'],
+            )
+        return kwargs
+
     async def start(self):
         """启动双通道翻译器"""
 
         self.is_running = True
         self.stats['start_time'] = time.time()
 
+        translators = [t for t in (self.translator_zh_to_en, self.translator_en_to_zh) if t]
+
+        # 0. 先启动会话预热池和热备，让建连握手与设备启动重叠进行
+        for translator in translators:
+            translator.start_session_pool()
+            translator.start_hot_standby()
+
         # 1. 启动音频捕获
         sys_log.info("启动音频捕获...")
         if self.mic_capturer:
@@ -458,18 +517,22 @@ class DualChannelTranslator:
             ch2_log.info("启动字幕窗口...")
             self.subtitle_window_thread.start()
 
-        # 4. 连接火山引擎
+        # 4. 连接火山引擎 (两个方向并发握手)
         sys_log.info("连接火山引擎...")
+        connect_started = time.perf_counter()
 
-        if self.translator_zh_to_en:
-            await self.translator_zh_to_en.connect()
-            await self.translator_zh_to_en.start_session()
-            ch1_log.info("火山引擎已连接")
+        async def connect_channel(translator, channel_log):
+            await translator.connect()
+            await translator.start_session()
+            channel_log.info("火山引擎已连接")
 
+        connect_jobs = []
+        if self.translator_zh_to_en:
+            connect_jobs.append(connect_channel(self.translator_zh_to_en, ch1_log))
         if self.translator_en_to_zh:
-            await self.translator_en_to_zh.connect()
-            await self.translator_en_to_zh.start_session()
-            ch2_log.info("火山引擎已连接")
+            connect_jobs.append(connect_channel(self.translator_en_to_zh, ch2_log))
+        await asyncio.gather(*connect_jobs)
+        sys_log.info("火山引擎就绪，耗时 %.0fms", (time.perf_counter() - connect_started) * 1000)
 
         # 5. 打印启动信息
         sys_log.info("=" * 60)
@@ -492,6 +555,7 @@ class DualChannelTranslator:
 
         关键: 两个通道完全独立，无需冲突检测!
         """
+        from core.event_stream import EVENT_AUDIO, EVENT_SOURCE_SUBTITLE, EVENT_TRANSLATION_SUBTITLE
 
         async def channel1_loop():
             """Channel 1: 麦克风 → 英文语音"""
@@ -500,53 +564,58 @@ class DualChannelTranslator:
             async def send_audio():
                 """发送音频循环"""
                 loop = asyncio.get_running_loop()
+                translator = self.translator_zh_to_en
                 while self.is_running:
-                    chunk = await loop.run_in_executor(None, self.mic_capturer.get_chunk, 0.1)
+                    # 等待时长不超过分帧器的滞留时限，保证不足一帧的尾巴按时发出
+                    timeout = translator.audio_flush_timeout(0.1)
+                    chunk = await loop.run_in_executor(None, self.mic_capturer.get_chunk, timeout)
 
                     if chunk:
-                        await self.translator_zh_to_en.send_audio(chunk)
+                        await translator.send_audio(chunk)
                         self.stats['ch1_audio_chunks'] += 1
+                    await translator.flush_audio()
+
+            def on_text(result):
+                """文本事件由接收任务直接回调计数，无需排队"""
+                if not result.text:
+                    return
+                self.stats['ch1_text_segments'] += 1
+                ch1_log.debug("← text #%d %r", self.stats['ch1_text_segments'], result.text)
+
+                if self.stats['ch1_text_segments'] % 20 == 0:
+                    ch1_log.info("进度: 已接收 %d 条文本", self.stats['ch1_text_segments'])
+
+            self.translator_zh_to_en.add_event_callback(EVENT_SOURCE_SUBTITLE, on_text)
+            self.translator_zh_to_en.add_event_callback(EVENT_TRANSLATION_SUBTITLE, on_text)
+            audio_events = self.translator_zh_to_en.subscribe(EVENT_AUDIO, name="ch1_audio")
+            self.translator_zh_to_en.start_reader()
 
             async def receive_result():
-                """接收结果循环"""
+                """接收音频循环: 只等待音频事件"""
                 while self.is_running:
                     try:
-                        result = await asyncio.wait_for(
-                            self.translator_zh_to_en.receive_result(),
-                            timeout=1.0
-                        )
-
-                        if result:
-                            # 记录首次音频时间
-                            if result.audio_data and not self.stats['first_ch1_audio_time']:
-                                self.stats['first_ch1_audio_time'] = time.time()
-                                first_delay = self.stats['first_ch1_audio_time'] - self.stats['start_time']
-                                ch1_log.info("首次音频延迟: %.2f秒", first_delay)
-
-                            # 处理文本
-                            if result.text:
-                                self.stats['ch1_text_segments'] += 1
-                                ch1_log.debug("← text #%d %r", self.stats['ch1_text_segments'], result.text)
+                        result = await audio_events.get()
+                        if result is None or not result.audio_data:
+                            continue
 
-                                if self.stats['ch1_text_segments'] % 20 == 0:
-                                    ch1_log.info("进度: 已接收 %d 条文本", self.stats['ch1_text_segments'])
+                        # 记录首次音频时间
+                        if not self.stats['first_ch1_audio_time']:
+                            self.stats['first_ch1_audio_time'] = time.time()
+                            first_delay = self.stats['first_ch1_audio_time'] - self.stats['start_time']
+                            ch1_log.info("首次音频延迟: %.2f秒", first_delay)
 
-                            # 处理音频
-                            if result.audio_data:
-                                self.stats['ch1_audio_received'] += 1
-                                self.stats['total_ch1_audio_bytes'] += len(result.audio_data)
+                        self.stats['ch1_audio_received'] += 1
+                        self.stats['total_ch1_audio_bytes'] += len(result.audio_data)
 
-                                ch1_log.debug("← audio #%d %dB", self.stats['ch1_audio_received'], len(result.audio_data))
+                        ch1_log.debug("← audio #%d %dB", self.stats['ch1_audio_received'], len(result.audio_data))
 
-                                if self.stats['ch1_audio_received'] % 50 == 0:
-                                    mb = self.stats['total_ch1_audio_bytes'] / 1024 / 1024
-                                    ch1_log.info("音频进度: %d 块, %.2fMB", self.stats['ch1_audio_received'], mb)
+                        if self.stats['ch1_audio_received'] % 50 == 0:
+                            mb = self.stats['total_ch1_audio_bytes'] / 1024 / 1024
+                            ch1_log.info("音频进度: %d 块, %.2fMB", self.stats['ch1_audio_received'], mb)
 
-                                # 播放音频到 VB-CABLE
-                                self.audio_player.play(result.audio_data)
+                        # 播放音频到 VB-CABLE
+                        self.audio_player.play(result.audio_data)
 
-                    except asyncio.TimeoutError:
-                        pass
                     except Exception as e:
                         ch1_log.error("接收错误: %s", e)
 
@@ -579,6 +648,25 @@ class DualChannelTranslator:
                             translator_snapshot["last_audio_sequence"],
                             translator_snapshot["last_audio_delta_ms"],
                         )
+                        upstream = translator_snapshot.get("upstream")
+                        if upstream:
+                            ch1_log.info(
+                                "CH1上行分帧: %.1f帧/s %.1fKB/s 平均帧=%.1fms 时限发送=%s 滞留=%.1fms",
+                                upstream["frames_per_sec"],
+                                upstream["bytes_per_sec"] / 1024,
+                                upstream["avg_frame_ms"],
+                                upstream["deadline_flushes"],
+                                upstream["pending_ms"],
+                            )
+                        audio_stream = translator_snapshot["event_stream"]["subscriptions"].get("ch1_audio")
+                        if audio_stream:
+                            ch1_log.info(
+                                "CH1接收分发: 队列=%s (峰值%s) 分发延迟 avg=%.2fms p95=%.2fms",
+                                audio_stream["depth"],
+                                audio_stream["max_depth"],
+                                audio_stream["dispatch_avg_ms"],
+                                audio_stream["dispatch_p95_ms"],
+                            )
 
                     if player_snapshot:
                         ch1_log.info(
@@ -605,55 +693,66 @@ class DualChannelTranslator:
             async def send_audio():
                 """发送音频循环"""
                 loop = asyncio.get_running_loop()
+                translator = self.translator_en_to_zh
                 while self.is_running:
-                    chunk = await loop.run_in_executor(None, self.system_audio_capturer.get_chunk, 0.1)
+                    # 等待时长不超过分帧器的滞留时限，保证不足一帧的尾巴按时发出
+                    timeout = translator.audio_flush_timeout(0.1)
+                    chunk = await loop.run_in_executor(None, self.system_audio_capturer.get_chunk, timeout)
 
                     if chunk:
-                        await self.translator_en_to_zh.send_audio(chunk)
+                        await translator.send_audio(chunk)
                         self.stats['ch2_audio_chunks'] += 1
+                    await translator.flush_audio()
+
+            # 原文/译文字幕共用一个队列，保持两者的相对顺序
+            subtitle_events = self.translator_en_to_zh.subscribe(
+                EVENT_SOURCE_SUBTITLE, EVENT_TRANSLATION_SUBTITLE, name="ch2_subtitle"
+            )
+            self.translator_en_to_zh.start_reader()
 
             async def receive_result():
-                """接收结果循环"""
+                """接收字幕循环: 只等待字幕生命周期事件"""
                 while self.is_running:
                     try:
-                        result = await asyncio.wait_for(
-                            self.translator_en_to_zh.receive_result(),
-                            timeout=1.0
+                        result = await subtitle_events.get()
+                        if result is None:
+                            continue
+
+                        # 记录首次文本时间
+                        if result.text and not self.stats['first_ch2_text_time']:
+                            self.stats['first_ch2_text_time'] = time.time()
+                            first_delay = self.stats['first_ch2_text_time'] - self.stats['start_time']
+                            ch2_log.info("首次文本延迟: %.2f秒", first_delay)
+
+                        self.stats['ch2_text_segments'] += 1
+                        ch2_log.debug(
+                            "← 字幕事件 #%d event=%s text=%r",
+                            self.stats['ch2_text_segments'],
+                            result.event,
+                            result.text,
                         )
 
-                        if result:
-                            # 记录首次文本时间
-                            if (
-                                result.text
-                                and result.event in CH2_SUBTITLE_EVENTS
-                                and not self.stats['first_ch2_text_time']
-                            ):
-                                self.stats['first_ch2_text_time'] = time.time()
-                                first_delay = self.stats['first_ch2_text_time'] - self.stats['start_time']
-                                ch2_log.info("首次文本延迟: %.2f秒", first_delay)
-
-                            # 仅处理字幕生命周期事件，避免把其他文本事件误当成 CH2 字幕
-                            if result.event in CH2_SUBTITLE_EVENTS:
-                                self.stats['ch2_text_segments'] += 1
-                                ch2_log.debug(
-                                    "← 字幕事件 #%d event=%s text=%r",
-                                    self.stats['ch2_text_segments'],
-                                    result.event,
-                                    result.text,
-                                )
-
-                                if self.stats['ch2_text_segments'] % 20 == 0:
-                                    ch2_log.info("进度: 已接收 %d 条字幕", self.stats['ch2_text_segments'])
-
-                                self._handle_ch2_subtitle_result(result)
-
-                    except asyncio.TimeoutError:
-                        self._flush_stale_ch2_sentence(timeout_seconds=3.0)
+                        if self.stats['ch2_text_segments'] % 20 == 0:
+                            ch2_log.info("进度: 已接收 %d 条字幕", self.stats['ch2_text_segments'])
+
+                        self._handle_ch2_subtitle_result(result)
+
                     except Exception as e:
                         ch2_log.error("接收错误: %s", e)
 
             await asyncio.gather(send_audio(), receive_result())
 
+        async def housekeeping_loop():
+            """定时任务: 兜底结束超时未收尾的 CH2 句子；停止时唤醒所有订阅队列"""
+            while self.is_running:
+                await asyncio.sleep(0.5)
+                if self.translator_en_to_zh:
+                    self._flush_stale_ch2_sentence(timeout_seconds=3.0)
+
+            for translator in (self.translator_zh_to_en, self.translator_en_to_zh):
+                if translator:
+                    translator.wake_subscribers()
+
         async def ui_event_loop():
             """UI 事件处理循环 (处理字幕窗口事件)"""
             while self.is_running:
@@ -678,6 +777,8 @@ class DualChannelTranslator:
             if self.translator_en_to_zh:
                 tasks.append(channel2_loop())
 
+            tasks.append(housekeeping_loop())
+
             await asyncio.gather(*tasks)
         except asyncio.CancelledError:
             sys_log.info("主循环被取消")
@@ -742,6 +843,45 @@ class DualChannelTranslator:
             first_delay = self.stats['first_ch2_text_time'] - self.stats['start_time']
             ch2_log.info("首次响应: %.2f秒", first_delay)
 
+        for translator, channel_log in (
+            (self.translator_zh_to_en, ch1_log),
+            (self.translator_en_to_zh, ch2_log),
+        ):
+            framer = getattr(translator, 'audio_framer', None)
+            if framer:
+                framing_stats = framer.get_stats()
+                channel_log.info(
+                    "上行: %d 帧 %.2fKB | 平均帧 %.1fms | 时限发送 %d 次",
+                    framing_stats['frames_total'], framing_stats['bytes_total'] / 1024,
+                    framing_stats['avg_frame_ms'], framing_stats['deadline_flushes'],
+                )
+
+            if translator and hasattr(translator, 'get_recovery_stats'):
+                recovery = translator.get_recovery_stats()
+                if recovery['recoveries']:
+                    channel_log.info(
+                        "会话恢复: %d 次 | 最大间隔 %.0fms | 回放 %.2f秒 | 丢失 %.2f秒",
+                        recovery['recoveries'], recovery['max_gap_ms'],
+                        recovery['replayed_seconds_total'], recovery['lost_seconds_total'],
+                    )
+
+            standby = getattr(translator, 'hot_standby', None)
+            if standby:
+                standby_stats = standby.get_stats()
+                channel_log.info(
+                    "热备: 切换 %d 次 | 切换耗时 avg %.2fms max %.2fms | 重建 %d 次",
+                    standby_stats['switchovers'], standby_stats['avg_switchover_ms'],
+                    standby_stats['max_switchover_ms'], standby_stats['builds'],
+                )
+
+            pool = getattr(translator, 'session_pool', None)
+            if pool:
+                pool_stats = pool.get_stats()
+                channel_log.info(
+                    "预热池: 接管 %d 次 | 未命中 %d 次 | 累计节省 %.2f秒",
+                    pool_stats['handoffs'], pool_stats['misses'], pool_stats['saved_seconds_total'],
+                )
+
         sys_log.info("=" * 60)
 
 
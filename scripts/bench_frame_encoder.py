@@ -0,0 +1,64 @@
+"""
+TaskRequest 编码微基准
+
+对比 "每帧新建 TranslateRequest + SerializeToString()" 与预序列化前缀的
+TaskRequestEncoder 在不同帧长下的单帧耗时。
+
+用法:
+  python scripts/bench_frame_encoder.py
+  python scripts/bench_frame_encoder.py --frames-ms 20 100 200 --number 20000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import uuid
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.frame_encoder import TaskRequestEncoder  # noqa: E402
+from core.volcengine_client import TranslateRequest, Type  # noqa: E402
+
+BYTES_PER_MS = 32  # 16kHz / 16bit / mono
+
+
+def _protobuf_path(session_id, audio):
+    request = TranslateRequest()
+    request.request_meta.SessionID = session_id
+    request.event = Type.TaskRequest
+    request.source_audio.binary_data = audio
+    return request.SerializeToString()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TaskRequest 编码微基准")
+    parser.add_argument("--frames-ms", type=int, nargs="+", default=[10, 20, 40, 100, 200, 1000])
+    parser.add_argument("--number", type=int, default=20000, help="每轮编码次数")
+    parser.add_argument("--repeat", type=int, default=5, help="轮数，取最快一轮")
+    args = parser.parse_args()
+
+    session_id = str(uuid.uuid4())
+    prefix_request = TranslateRequest()
+    prefix_request.request_meta.SessionID = session_id
+    prefix_request.event = Type.TaskRequest
+    encoder = TaskRequestEncoder(session_id, prefix_request.SerializeToString())
+
+    print(f"{'帧长':>8} {'字节':>8} {'protobuf(us)':>14} {'encoder(us)':>13} {'加速':>7}")
+    for frame_ms in args.frames_ms:
+        audio = os.urandom(frame_ms * BYTES_PER_MS)
+        assert encoder.encode(audio) == _protobuf_path(session_id, audio)
+
+        baseline = min(timeit.repeat(
+            lambda: _protobuf_path(session_id, audio), number=args.number, repeat=args.repeat,
+        )) / args.number * 1e6
+        fast = min(timeit.repeat(
+            lambda: encoder.encode(audio), number=args.number, repeat=args.repeat,
+        )) / args.number * 1e6
+        print(f"{frame_ms:>6}ms {len(audio):>8} {baseline:>14.2f} {fast:>13.2f} {baseline / fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+VolcengineTranslator 离线压测脚本
+
+默认在进程内拉起 scripts/mock_ast_server.py，按 "语音 + 停顿" 的节奏推送伪语音，
+统计上行吞吐和每句端到端延迟 (句尾音频发出 → 首条源字幕 / 首个译文音频包)。
+
+用法:
+  python scripts/bench_translator.py --sessions 2 --sentences 10
+  python scripts/bench_translator.py --speed 0          # 不按实时节奏，尽可能快
+  python scripts/bench_translator.py --url ws://127.0.0.1:18800   # 压测外部模拟服务端
+  python scripts/bench_translator.py --chunk-ms 20 --frame-ms 40  # 对比上行分帧时长
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from mock_ast_server import MockAstServer, MockServerConfig, synth_silence_pcm, synth_speech_pcm  # noqa: E402
+
+from core.volcengine_client import Type, VolcengineConfig, VolcengineTranslator  # noqa: E402
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run_session(url: str, args, index: int) -> dict:
+    translator = VolcengineTranslator(
+        config=VolcengineConfig(ws_url=url, app_key="bench", access_key="bench"),
+        mode=args.mode,
+        source_language="zh",
+        target_language="en",
+        target_audio_format=args.target_format,
+        target_audio_rate=48000 if args.target_format == "pcm" else 24000,
+        auto_reconnect=False,
+        frame_ms=args.frame_ms or None,
+    )
+
+    speech = synth_speech_pcm(args.speech_ms)
+    pause = synth_silence_pcm(args.pause_ms)
+    chunk_ms = args.chunk_ms
+    chunk_bytes = 16000 * 2 * chunk_ms // 1000
+
+    sentence_end_sent = []
+    first_text_at = {}
+    first_audio_at = {}
+    counters = {"chunks": 0, "bytes": 0, "responses": 0}
+
+    t0 = time.perf_counter()
+    await translator.connect()
+    await translator.start_session()
+    handshake_ms = (time.perf_counter() - t0) * 1000
+
+    async def sender():
+        started = time.perf_counter()
+        sent_ms = 0
+        for _ in range(args.sentences):
+            for segment, is_speech in ((speech, True), (pause, False)):
+                for offset in range(0, len(segment), chunk_bytes):
+                    await translator.send_audio(segment[offset:offset + chunk_bytes])
+                    await translator.flush_audio()
+                    counters["chunks"] += 1
+                    counters["bytes"] += chunk_bytes
+                    sent_ms += chunk_ms
+                    if args.speed > 0:
+                        delay = started + sent_ms / 1000 / args.speed - time.perf_counter()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                if is_speech:
+                    sentence_end_sent.append(time.perf_counter())
+        await translator.flush_audio(force=True)
+        return time.perf_counter() - started
+
+    async def receiver():
+        sentence = 0
+        while True:
+            result = await translator.receive_result()
+            if result is None or result.is_finished or result.is_failed:
+                return
+            counters["responses"] += 1
+            now = time.perf_counter()
+            if result.event == Type.SourceSubtitleStart:
+                sentence += 1
+            if result.event == Type.SourceSubtitleResponse and sentence not in first_text_at:
+                first_text_at[sentence] = now
+            if result.audio_data and sentence not in first_audio_at:
+                first_audio_at[sentence] = now
+
+    receive_task = asyncio.create_task(receiver())
+    send_seconds = await sender()
+    await asyncio.sleep(args.drain_ms / 1000)
+    receive_task.cancel()
+    await asyncio.gather(receive_task, return_exceptions=True)
+    upstream = translator.get_debug_snapshot()["upstream"]
+    await translator.close()
+
+    text_latency = [
+        (first_text_at[i] - sentence_end_sent[i - 1]) * 1000
+        for i in first_text_at if i - 1 < len(sentence_end_sent)
+    ]
+    audio_latency = [
+        (first_audio_at[i] - sentence_end_sent[i - 1]) * 1000
+        for i in first_audio_at if i - 1 < len(sentence_end_sent)
+    ]
+    return {
+        "index": index,
+        "handshake_ms": handshake_ms,
+        "send_seconds": send_seconds,
+        "frames": upstream["frames_total"] if upstream else counters["chunks"],
+        "avg_frame_ms": upstream["avg_frame_ms"] if upstream else float(chunk_ms),
+        "bytes": counters["bytes"],
+        "responses": counters["responses"],
+        "text_latency_ms": text_latency,
+        "audio_latency_ms": audio_latency,
+    }
+
+
+async def _bench(args):
+    server = None
+    url = args.url
+    if not url:
+        server = MockAstServer(MockServerConfig(
+            processing_delay_ms=args.delay_ms,
+            burst_size=args.burst_size,
+            sentence_gap_ms=args.sentence_gap_ms,
+        ))
+        url = await server.start()
+
+    try:
+        results = await asyncio.gather(*(_run_session(url, args, i) for i in range(args.sessions)))
+    finally:
+        if server:
+            await server.stop()
+
+    print("=" * 72)
+    print(
+        f"sessions={args.sessions} mode={args.mode} target={args.target_format} speed={args.speed or 'max'} "
+        f"chunk={args.chunk_ms}ms frame={args.frame_ms or 'passthrough'}"
+    )
+    print("-" * 72)
+    all_text, all_audio = [], []
+    for r in results:
+        fps = r["frames"] / r["send_seconds"] if r["send_seconds"] else 0.0
+        kbps = r["bytes"] * 8 / 1000 / r["send_seconds"] if r["send_seconds"] else 0.0
+        all_text += r["text_latency_ms"]
+        all_audio += r["audio_latency_ms"]
+        print(
+            f"[{r['index']}] handshake={r['handshake_ms']:.1f}ms frames={r['frames']} avg_frame={r['avg_frame_ms']:.0f}ms "
+            f"send={fps:.1f} frames/s {kbps:.0f} kbit/s responses={r['responses']}"
+        )
+    for name, values in (("句尾→首条字幕", all_text), ("句尾→首个音频", all_audio)):
+        if values:
+            print(
+                f"{name}: n={len(values)} mean={statistics.mean(values):.1f}ms "
+                f"p50={_percentile(values, 50):.1f}ms p95={_percentile(values, 95):.1f}ms "
+                f"max={max(values):.1f}ms"
+            )
+    print("=" * 72)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VolcengineTranslator 离线压测")
+    parser.add_argument("--url", default="", help="外部服务端地址，缺省时进程内启动模拟服务端")
+    parser.add_argument("--sessions", type=int, default=1, help="并发会话数")
+    parser.add_argument("--sentences", type=int, default=5, help="每个会话推送的句数")
+    parser.add_argument("--speech-ms", type=int, default=1500)
+    parser.add_argument("--pause-ms", type=int, default=800)
+    parser.add_argument("--chunk-ms", type=int, default=100, help="采集块时长(ms)")
+    parser.add_argument("--frame-ms", type=int, default=0, help="上行分帧目标时长(ms)，0 表示不分帧")
+    parser.add_argument("--speed", type=float, default=1.0, help="推送倍速，0 表示不限速")
+    parser.add_argument("--mode", default="s2s", choices=["s2s", "s2t"])
+    parser.add_argument("--target-format", default="pcm", choices=["pcm", "ogg_opus"])
+    parser.add_argument("--delay-ms", type=float, default=300.0)
+    parser.add_argument("--burst-size", type=int, default=4)
+    parser.add_argument("--sentence-gap-ms", type=float, default=200.0)
+    parser.add_argument("--drain-ms", type=int, default=3000, help="推送结束后等待回包的时间")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_bench(args))
+
+
+if __name__ == "__main__":
+    main()
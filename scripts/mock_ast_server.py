@@ -0,0 +1,496 @@
+"""
+本地模拟火山同传 (AST) 服务端
+
+使用与线上一致的 TranslateRequest / TranslateResponse protobuf 协议，
+用于离线压测 VolcengineTranslator 与 DualChannelTranslator，不消耗线上配额。
+
+支持的协议交互:
+  StartSession  → SessionStarted
+  TaskRequest   → 按能量切句，每句依次推送
+                  SourceSubtitle Start/Response/End
+                  TranslationSubtitle Start/Response/End
+                  (s2s) TTSSentenceStart → 突发 TTSResponse(pcm / ogg_opus) → TTSSentenceEnd
+                  UsageResponse
+  FinishSession → 补齐未完成句 → UsageResponse → SessionFinished
+
+用法:
+  python scripts/mock_ast_server.py --port 18800 --delay-ms 300 --burst-size 4
+  # config.yaml 中把 volcengine.ws_url 改为 ws://127.0.0.1:18800 即可
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import os
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    from websockets.asyncio.server import serve  # websockets >= 14
+except ImportError:
+    from websockets import serve  # fallback
+
+import websockets
+
+# 确保项目根目录在 Python 路径中
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.ogg import (  # noqa: E402
+    OPUS_GRANULE_RATE,
+    OPUS_SILENCE_FRAME,
+    OPUS_SILENCE_FRAME_SAMPLES,
+    OggPageWriter,
+    build_opus_head,
+    build_opus_tags,
+)
+from core.volcengine_client import TranslateRequest, TranslateResponse, Type  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# 切句分析帧长
+_ANALYSIS_FRAME_MS = 20
+
+_FAKE_WORDS = {
+    "en": ["hello", "thanks", "meeting", "agenda", "budget", "next", "quarter", "team", "update", "plan"],
+    "zh": ["你好", "谢谢", "会议", "议程", "预算", "下个", "季度", "团队", "进展", "计划"],
+    "ja": ["こんにちは", "ありがとう", "会議", "議題", "予算", "次の", "四半期", "チーム", "進捗", "計画"],
+}
+
+
+@dataclass
+class MockServerConfig:
+    """模拟服务端参数"""
+    host: str = "127.0.0.1"
+    port: int = 0
+    processing_delay_ms: float = 300.0   # 句尾 → 首条字幕的处理延迟
+    text_step_delay_ms: float = 30.0     # 字幕 Response 之间的间隔
+    text_steps: int = 3                  # 每句字幕的增量 Response 数
+    tts_delay_ms: float = 200.0          # 译文字幕结束 → 首个音频包
+    audio_packet_ms: int = 120           # 每个 TTSResponse 携带的音频时长
+    burst_size: int = 4                  # 每次突发连续推送的音频包数
+    burst_interval_ms: float = 300.0     # 突发之间的间隔
+    tts_ratio: float = 1.0               # 合成音频时长 / 源语音时长
+    sentence_gap_ms: float = 200.0       # 相邻两句输出之间的最小间隔
+    energy_threshold: float = 300.0      # int16 RMS 语音判定阈值
+    silence_ms: int = 400                # 连续静音多久判定句尾
+    max_sentence_ms: int = 6000          # 单句最长时长，超出强制断句
+    min_sentence_ms: int = 200           # 短于此时长的语音段视为噪声
+    fail_after_audio_ms: Optional[int] = None  # 收到多少毫秒音频后注入 SessionFailed
+    fail_message: str = "Engine:1022 Model inference error"
+    require_auth: bool = True
+
+
+@dataclass
+class _Sentence:
+    index: int
+    start_ms: int
+    end_ms: int
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+
+@dataclass
+class _SessionState:
+    """单个会话的上下文"""
+    session_id: str
+    mode: str
+    source_language: str
+    target_language: str
+    source_rate: int
+    target_format: str
+    target_rate: int
+    sequence: int = 0
+    received_ms: float = 0.0
+    received_bytes: int = 0
+    sentence_count: int = 0
+    word_count: int = 0
+    in_speech: bool = False
+    speech_start_ms: int = 0
+    silence_run_ms: int = 0
+    pending: bytearray = field(default_factory=bytearray)
+    failed: bool = False
+    ogg_writer: Optional[OggPageWriter] = None
+    ogg_granule: int = 0
+    tone_phase: float = 0.0
+
+
+def synth_speech_pcm(duration_ms: int, sample_rate: int = 16000, freq: float = 220.0,
+                     amplitude: float = 0.3) -> bytes:
+    """生成一段带包络的伪语音 (int16 PCM)，用于压测和测试。"""
+    n = int(sample_rate * duration_ms / 1000)
+    t = np.arange(n, dtype=np.float32) / sample_rate
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 3.0 * t)
+    wave = amplitude * envelope * np.sin(2 * np.pi * freq * t)
+    return (wave * 32767).astype(np.int16).tobytes()
+
+
+def synth_silence_pcm(duration_ms: int, sample_rate: int = 16000) -> bytes:
+    """生成数字静音 (int16 PCM)。"""
+    return b"\x00\x00" * int(sample_rate * duration_ms / 1000)
+
+
+class MockAstServer:
+    """本地模拟 AST 服务端"""
+
+    def __init__(self, config: Optional[MockServerConfig] = None):
+        self.config = config or MockServerConfig()
+        self._server = None
+        self.port: Optional[int] = None
+
+        # 全局统计，供压测脚本读取
+        self.stats = {
+            "connections": 0,
+            "sessions_started": 0,
+            "sessions_finished": 0,
+            "sessions_failed": 0,
+            "task_frames": 0,
+            "audio_bytes_received": 0,
+            "sentences": 0,
+            "responses_sent": 0,
+        }
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.config.host}:{self.port}"
+
+    async def start(self) -> str:
+        """启动服务端，返回 ws 地址。"""
+        self._server = await serve(
+            self._handle_connection,
+            self.config.host,
+            self.config.port,
+            process_response=self._process_response,
+            max_size=None,
+            ping_interval=None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("模拟 AST 服务端已启动: %s", self.url)
+        return self.url
+
+    async def stop(self):
+        """停止服务端。"""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            logger.info("模拟 AST 服务端已停止")
+
+    @staticmethod
+    def _process_response(connection, request, response):
+        """与线上一致地回写 X-Tt-Logid 响应头。"""
+        response.headers["X-Tt-Logid"] = f"mock-{uuid.uuid4().hex[:16]}"
+        return response
+
+    # ─── 连接与会话 ───────────────────────────────────────────
+
+    async def _handle_connection(self, websocket):
+        headers = websocket.request.headers
+        if self.config.require_auth and not (
+            headers.get("X-Api-App-Key") and headers.get("X-Api-Access-Key")
+        ):
+            await websocket.close(4001, "authentication failed: missing app key")
+            return
+
+        self.stats["connections"] += 1
+        session: Optional[_SessionState] = None
+        output_queue: Optional[asyncio.Queue] = None
+        output_task: Optional[asyncio.Task] = None
+        send_lock = asyncio.Lock()
+
+        async def send(event: int, **kwargs):
+            response = TranslateResponse()
+            response.response_meta.SessionID = session.session_id
+            session.sequence += 1
+            response.response_meta.Sequence = session.sequence
+            response.event = event
+            message = kwargs.pop("message", None)
+            if message:
+                response.response_meta.Message = message
+            billing = kwargs.pop("billing", None)
+            if billing:
+                response.response_meta.Billing.DurationMsec = billing["duration_ms"]
+                response.response_meta.Billing.WordCount = billing["word_count"]
+                item = response.response_meta.Billing.Items.add()
+                item.Unit = "second"
+                item.Quantity = billing["duration_ms"] / 1000.0
+            for key, value in kwargs.items():
+                setattr(response, key, value)
+            async with send_lock:
+                await websocket.send(response.SerializeToString())
+            self.stats["responses_sent"] += 1
+
+        try:
+            async for raw in websocket:
+                request = TranslateRequest()
+                request.ParseFromString(raw)
+
+                if request.event == Type.StartSession:
+                    if output_task:
+                        await self._drain_output(output_queue, output_task)
+                    session = self._create_session(request)
+                    output_queue = asyncio.Queue()
+                    output_task = asyncio.create_task(self._output_loop(session, output_queue, send))
+                    self.stats["sessions_started"] += 1
+                    await send(Type.SessionStarted)
+
+                elif request.event == Type.TaskRequest:
+                    if session is None or session.failed:
+                        continue
+                    self.stats["task_frames"] += 1
+                    self._feed_audio(session, request.source_audio.binary_data, output_queue)
+
+                    fail_after = self.config.fail_after_audio_ms
+                    if fail_after is not None and session.received_ms >= fail_after:
+                        session.failed = True
+                        self.stats["sessions_failed"] += 1
+                        await self._drain_output(output_queue, output_task)
+                        output_task = None
+                        await send(Type.SessionFailed, message=self.config.fail_message)
+
+                elif request.event == Type.FinishSession:
+                    if session is None:
+                        continue
+                    self._flush_sentence(session, output_queue, force=True)
+                    if output_task:
+                        await self._drain_output(output_queue, output_task)
+                        output_task = None
+                    await send(Type.UsageResponse, billing=self._billing(session))
+                    await send(Type.SessionFinished)
+                    self.stats["sessions_finished"] += 1
+                    session = None
+
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if output_task and not output_task.done():
+                output_task.cancel()
+
+    def _create_session(self, request) -> _SessionState:
+        session = _SessionState(
+            session_id=request.request_meta.SessionID or str(uuid.uuid4()),
+            mode=request.request.mode or "s2t",
+            source_language=request.request.source_language or "zh",
+            target_language=request.request.target_language or "en",
+            source_rate=request.source_audio.rate or 16000,
+            target_format=request.target_audio.format or "ogg_opus",
+            target_rate=request.target_audio.rate or 24000,
+        )
+        if session.mode == "s2s" and session.target_format == "ogg_opus":
+            session.ogg_writer = OggPageWriter()
+        logger.info(
+            "会话开始: id=%s mode=%s %s→%s target=%s@%s",
+            session.session_id, session.mode, session.source_language,
+            session.target_language, session.target_format, session.target_rate,
+        )
+        return session
+
+    @staticmethod
+    async def _drain_output(queue: asyncio.Queue, task: asyncio.Task):
+        """等待当前会话已切好的句子全部推送完毕。"""
+        await queue.put(None)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    # ─── 切句 ─────────────────────────────────────────────────
+
+    def _feed_audio(self, session: _SessionState, data: bytes, queue: asyncio.Queue):
+        """按 20ms 帧做能量判定，检测句首/句尾。"""
+        self.stats["audio_bytes_received"] += len(data)
+        session.received_bytes += len(data)
+        session.pending += data
+
+        frame_bytes = int(session.source_rate * _ANALYSIS_FRAME_MS / 1000) * 2
+        usable = len(session.pending) - len(session.pending) % frame_bytes
+        if usable <= 0:
+            return
+
+        samples = np.frombuffer(bytes(session.pending[:usable]), dtype=np.int16).astype(np.float32)
+        del session.pending[:usable]
+        rms = np.sqrt(np.mean(samples.reshape(-1, frame_bytes // 2) ** 2, axis=1))
+
+        for level in rms:
+            frame_start = int(session.received_ms)
+            session.received_ms += _ANALYSIS_FRAME_MS
+
+            if level >= self.config.energy_threshold:
+                if not session.in_speech:
+                    session.in_speech = True
+                    session.speech_start_ms = frame_start
+                session.silence_run_ms = 0
+            elif session.in_speech:
+                session.silence_run_ms += _ANALYSIS_FRAME_MS
+
+            if not session.in_speech:
+                continue
+
+            speech_ms = session.received_ms - session.speech_start_ms
+            if session.silence_run_ms >= self.config.silence_ms or speech_ms >= self.config.max_sentence_ms:
+                self._flush_sentence(session, queue)
+
+    def _flush_sentence(self, session: _SessionState, queue: Optional[asyncio.Queue], force: bool = False):
+        """结束当前语音段，满足最短时长时投递到输出队列。"""
+        if not session.in_speech:
+            return
+        end_ms = int(session.received_ms - session.silence_run_ms)
+        session.in_speech = False
+        session.silence_run_ms = 0
+
+        if end_ms - session.speech_start_ms < self.config.min_sentence_ms and not force:
+            return
+        if end_ms <= session.speech_start_ms or queue is None:
+            return
+
+        session.sentence_count += 1
+        self.stats["sentences"] += 1
+        queue.put_nowait(_Sentence(session.sentence_count, session.speech_start_ms, end_ms))
+
+    # ─── 输出 ─────────────────────────────────────────────────
+
+    async def _output_loop(self, session: _SessionState, queue: asyncio.Queue, send):
+        """按句串行推送字幕与音频，句间保持 sentence_gap_ms 间隔。"""
+        cfg = self.config
+        last_sentence_done = 0.0
+        while True:
+            sentence = await queue.get()
+            if sentence is None:
+                return
+
+            await asyncio.sleep(cfg.processing_delay_ms / 1000)
+            gap_left = cfg.sentence_gap_ms / 1000 - (time.perf_counter() - last_sentence_done)
+            if last_sentence_done and gap_left > 0:
+                await asyncio.sleep(gap_left)
+
+            n_words = max(1, sentence.duration_ms // 300)
+            source_text = self._fake_text(session.source_language, n_words, sentence.index)
+            target_text = self._fake_text(session.target_language, n_words, sentence.index)
+            session.word_count += n_words
+            times = {"start_time": sentence.start_ms, "end_time": sentence.end_ms}
+
+            await self._emit_subtitle(
+                send, source_text, times,
+                Type.SourceSubtitleStart, Type.SourceSubtitleResponse, Type.SourceSubtitleEnd,
+            )
+            await self._emit_subtitle(
+                send, target_text, times,
+                Type.TranslationSubtitleStart, Type.TranslationSubtitleResponse, Type.TranslationSubtitleEnd,
+            )
+
+            if session.mode == "s2s":
+                await asyncio.sleep(cfg.tts_delay_ms / 1000)
+                await self._emit_tts(session, send, sentence)
+
+            await send(Type.UsageResponse, billing=self._billing(session))
+            last_sentence_done = time.perf_counter()
+
+    async def _emit_subtitle(self, send, text: str, times: dict, start_event: int,
+                             response_event: int, end_event: int):
+        cfg = self.config
+        await send(start_event, **times)
+        words = text.split(" ")
+        steps = max(1, cfg.text_steps)
+        for step in range(1, steps + 1):
+            partial = " ".join(words[: max(1, math.ceil(len(words) * step / steps))])
+            await send(response_event, text=partial, **times)
+            await asyncio.sleep(cfg.text_step_delay_ms / 1000)
+        await send(end_event, text=text, **times)
+
+    async def _emit_tts(self, session: _SessionState, send, sentence: _Sentence):
+        cfg = self.config
+        await send(Type.TTSSentenceStart)
+
+        total_ms = max(cfg.audio_packet_ms, int(sentence.duration_ms * cfg.tts_ratio))
+        packet_count = max(1, math.ceil(total_ms / cfg.audio_packet_ms))
+        for index in range(packet_count):
+            if index and index % max(1, cfg.burst_size) == 0:
+                await asyncio.sleep(cfg.burst_interval_ms / 1000)
+            await send(Type.TTSResponse, data=self._make_audio(session, cfg.audio_packet_ms))
+
+        await send(Type.TTSSentenceEnd)
+
+    def _make_audio(self, session: _SessionState, duration_ms: int) -> bytes:
+        """生成一个音频包: pcm 为正弦音，ogg_opus 为合法的静音 Opus 页。"""
+        if session.target_format == "pcm":
+            n = int(session.target_rate * duration_ms / 1000)
+            phase = session.tone_phase + 2 * np.pi * 440.0 * np.arange(n) / session.target_rate
+            session.tone_phase = float(phase[-1] + 2 * np.pi * 440.0 / session.target_rate) if n else session.tone_phase
+            return (0.2 * np.sin(phase) * 32767).astype(np.int16).tobytes()
+
+        writer = session.ogg_writer
+        pages = b""
+        if writer.page_sequence == 0:
+            pages += writer.write_page([build_opus_head(channels=1, input_rate=session.target_rate)], 0)
+            pages += writer.write_page([build_opus_tags()], 0)
+        frames = max(1, duration_ms // 20)
+        session.ogg_granule += frames * OPUS_SILENCE_FRAME_SAMPLES
+        pages += writer.write_page([OPUS_SILENCE_FRAME] * frames, session.ogg_granule)
+        return pages
+
+    @staticmethod
+    def _fake_text(language: str, n_words: int, index: int) -> str:
+        words = _FAKE_WORDS.get(language, _FAKE_WORDS["en"])
+        return " ".join(words[(index + i) % len(words)] for i in range(n_words))
+
+    @staticmethod
+    def _billing(session: _SessionState) -> dict:
+        return {
+            "duration_ms": int(session.received_ms),
+            "word_count": session.word_count,
+        }
+
+
+async def _run_forever(config: MockServerConfig):
+    server = MockAstServer(config)
+    await server.start()
+    print(f"mock AST server listening on {server.url}", flush=True)
+    try:
+        await asyncio.Future()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟火山同传服务端")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18800)
+    parser.add_argument("--delay-ms", type=float, default=300.0, help="句尾到首条字幕的处理延迟")
+    parser.add_argument("--burst-size", type=int, default=4, help="每次突发的音频包数")
+    parser.add_argument("--burst-interval-ms", type=float, default=300.0, help="突发之间的间隔")
+    parser.add_argument("--packet-ms", type=int, default=120, help="每个音频包的时长")
+    parser.add_argument("--sentence-gap-ms", type=float, default=200.0, help="句间最小输出间隔")
+    parser.add_argument("--fail-after-ms", type=int, default=None, help="收到 N 毫秒音频后注入 SessionFailed")
+    parser.add_argument("--no-auth", action="store_true", help="不校验鉴权头")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    config = MockServerConfig(
+        host=args.host,
+        port=args.port,
+        processing_delay_ms=args.delay_ms,
+        burst_size=args.burst_size,
+        burst_interval_ms=args.burst_interval_ms,
+        audio_packet_ms=args.packet_ms,
+        sentence_gap_ms=args.sentence_gap_ms,
+        fail_after_audio_ms=args.fail_after_ms,
+        require_auth=not args.no_auth,
+    )
+    try:
+        asyncio.run(_run_forever(config))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()